@@ -3,14 +3,20 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
+import itertools
 import json
 import logging
 import os
 import random
+import threading
 import time
 from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, TypeVar
+
+import orjson
 
 from backend.game_engine import GameState, Move, MoveType, Resource
 from backend.negotiation_engine import (
@@ -88,12 +94,12 @@ def _llmobs_submit_evaluation(
         return
 
     try:
+        # Compare move type only — predictions use "aggressive_bid" while
+        # actual moves include target suffix like "aggressive_bid_A"
+        actual_type = actual_move.partition("_")[0]
         for i, pred in enumerate(predictions):
             predicted = pred.get("opponentMove", "")
-            # Compare move type only — predictions use "aggressive_bid" while
-            # actual moves include target suffix like "aggressive_bid_A"
-            predicted_type = predicted.split("_")[0] if "_" in predicted else predicted
-            actual_type = actual_move.split("_")[0] if "_" in actual_move else actual_move
+            predicted_type = predicted.partition("_")[0]
             was_correct = predicted == actual_move or predicted_type == actual_type
             _LLMObs.submit_evaluation(
                 span_context=span_context,
@@ -115,66 +121,87 @@ def _llmobs_submit_evaluation(
 # Personality configurations
 # ---------------------------------------------------------------------------
 
-AGENT_PERSONALITIES: dict[str, dict[str, Any]] = {
-    "aggressive": {
-        "description": "Favors high-risk, high-reward moves. Bluffs often.",
-        "temperature": 0.9,
-        "risk_tolerance": 0.8,
-        "bluff_frequency": 0.3,
-        "system_prompt_modifier": "You are an aggressive competitor who takes bold risks.",
-        "move_weights": {
+@dataclass(frozen=True, slots=True)
+class PersonalityConfig:
+    """Static tuning for one agent personality."""
+
+    description: str
+    temperature: float
+    risk_tolerance: float
+    bluff_frequency: float
+    system_prompt_modifier: str
+    move_weights: Mapping[MoveType, float]
+
+    def __post_init__(self) -> None:
+        # Read-only view: _MOVE_WEIGHT_COLUMNS is derived from these weights at import
+        object.__setattr__(self, "move_weights", MappingProxyType(dict(self.move_weights)))
+
+
+AGENT_PERSONALITIES: dict[str, PersonalityConfig] = {
+    "aggressive": PersonalityConfig(
+        description="Favors high-risk, high-reward moves. Bluffs often.",
+        temperature=0.9,
+        risk_tolerance=0.8,
+        bluff_frequency=0.3,
+        system_prompt_modifier="You are an aggressive competitor who takes bold risks.",
+        move_weights={
             MoveType.AGGRESSIVE_BID: 0.45,
             MoveType.DEFENSIVE_SPREAD: 0.10,
             MoveType.BLUFF: 0.25,
             MoveType.COUNTER: 0.10,
             MoveType.RETREAT: 0.10,
         },
-    },
-    "defensive": {
-        "description": "Conservative, methodical. Waits for opponent mistakes.",
-        "temperature": 0.3,
-        "risk_tolerance": 0.3,
-        "bluff_frequency": 0.05,
-        "system_prompt_modifier": "You are a cautious, defensive player who exploits mistakes.",
-        "move_weights": {
+    ),
+    "defensive": PersonalityConfig(
+        description="Conservative, methodical. Waits for opponent mistakes.",
+        temperature=0.3,
+        risk_tolerance=0.3,
+        bluff_frequency=0.05,
+        system_prompt_modifier="You are a cautious, defensive player who exploits mistakes.",
+        move_weights={
             MoveType.AGGRESSIVE_BID: 0.10,
             MoveType.DEFENSIVE_SPREAD: 0.40,
             MoveType.BLUFF: 0.05,
             MoveType.COUNTER: 0.35,
             MoveType.RETREAT: 0.10,
         },
-    },
-    "adaptive": {
-        "description": "Mirrors opponent's style. Adapts based on memory.",
-        "temperature": 0.6,
-        "risk_tolerance": 0.5,
-        "bluff_frequency": 0.15,
-        "system_prompt_modifier": "You adapt your strategy based on what's working.",
-        "move_weights": {
+    ),
+    "adaptive": PersonalityConfig(
+        description="Mirrors opponent's style. Adapts based on memory.",
+        temperature=0.6,
+        risk_tolerance=0.5,
+        bluff_frequency=0.15,
+        system_prompt_modifier="You adapt your strategy based on what's working.",
+        move_weights={
             MoveType.AGGRESSIVE_BID: 0.25,
             MoveType.DEFENSIVE_SPREAD: 0.25,
             MoveType.BLUFF: 0.15,
             MoveType.COUNTER: 0.25,
             MoveType.RETREAT: 0.10,
         },
-    },
-    "chaotic": {
-        "description": "Unpredictable. Maximizes opponent uncertainty.",
-        "temperature": 1.0,
-        "risk_tolerance": 0.6,
-        "bluff_frequency": 0.4,
-        "system_prompt_modifier": "You are deliberately unpredictable to confuse opponents.",
-        "move_weights": {
+    ),
+    "chaotic": PersonalityConfig(
+        description="Unpredictable. Maximizes opponent uncertainty.",
+        temperature=1.0,
+        risk_tolerance=0.6,
+        bluff_frequency=0.4,
+        system_prompt_modifier="You are deliberately unpredictable to confuse opponents.",
+        move_weights={
             MoveType.AGGRESSIVE_BID: 0.20,
             MoveType.DEFENSIVE_SPREAD: 0.15,
             MoveType.BLUFF: 0.30,
             MoveType.COUNTER: 0.15,
             MoveType.RETREAT: 0.20,
         },
-    },
+    ),
 }
 
 
+def _prompt_json(obj: Any) -> str:
+    """Serialize prompt context as compact JSON (no padding whitespace to spend tokens on)."""
+    return json.dumps(obj, separators=(",", ":"))
+
+
 def _build_intelligence_block(context: dict) -> str:
     """Format Neo4j patterns and accuracy into a prompt block. Returns '' if empty."""
     lines = []
@@ -208,19 +235,19 @@ def _build_system_prompt(
     base = f"""You are {agent_name}, a competitor in Agent Colosseum.
 
 GAME: resource_wars
-YOUR PERSONALITY: {config['description']}
-{config['system_prompt_modifier']}
+YOUR PERSONALITY: {config.description}
+{config.system_prompt_modifier}
 CURRENT ROUND: {game_state.round_number}/{game_state.total_rounds}
 CURRENT SCORE: You: {game_state.scores.get(agent_name, 0)} | Opponent: {game_state.scores.get('blue' if agent_name == 'red' else 'red', 0)}
 
 GAME STATE:
-{json.dumps(game_state.to_dict())}
+{_prompt_json(game_state.to_dict())}
 
 YOUR MOVE HISTORY:
-{json.dumps(my_history[-5:])}
+{_prompt_json(my_history[-5:])}
 
 OPPONENT'S MOVE HISTORY:
-{json.dumps(opponent_history[-5:])}
+{_prompt_json(opponent_history[-5:])}
 
 VALID MOVE TYPES: aggressive_bid, defensive_spread, bluff, counter, retreat
 VALID RESOURCES: A, B, C
@@ -266,7 +293,7 @@ Return ONLY valid JSON:
 # Prediction result
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class PredictionResult:
     predictions: list[dict] = field(default_factory=list)
     chosen_move: Optional[Move] = None
@@ -285,22 +312,55 @@ class PredictionResult:
 # Mock prediction engine — produces realistic-feeling results
 # ---------------------------------------------------------------------------
 
-def _weighted_choice(weights: dict[MoveType, float]) -> MoveType:
-    types = list(weights.keys())
-    probs = list(weights.values())
-    return random.choices(types, weights=probs, k=1)[0]
+# Move-type families used to guess the opponent's style from its history
+_AGGRESSIVE_MOVE_TYPES = frozenset({MoveType.AGGRESSIVE_BID.value})
+_DEFENSIVE_MOVE_TYPES = frozenset({MoveType.DEFENSIVE_SPREAD.value, MoveType.COUNTER.value})
+
+# Round phase: rounds 1-3 early, 4-7 mid, 8+ end (bisect against upper bounds)
+_ROUND_PHASE_BOUNDS = (3, 7)
+_ROUND_PHASE_LABELS = ("early game aggression", "mid-game adaptation", "end-game push")
+
+_RESOURCES = tuple(Resource)
+
+# Formatted lazily so only the chosen reasoning string is built per prediction
+_PREDICTION_REASONING_TEMPLATES = (
+    "Opponent likely to {move} based on recent pattern",
+    "Historical data suggests {move} on {resource}",
+    "Game state favors opponent playing {move}",
+    "Based on score differential, expect {move}",
+)
+
+
+_M = TypeVar("_M")
+
+
+def _weight_columns(weights: Mapping[_M, float]) -> tuple[tuple[_M, ...], tuple[float, ...]]:
+    """Split a ``{move_type: weight}`` table into (move types, cumulative weights) columns."""
+    return tuple(weights), tuple(itertools.accumulate(weights.values()))
+
+
+def _weighted_choice(columns: tuple[tuple[_M, ...], tuple[float, ...]]) -> _M:
+    """Pick one move type from columns built by :func:`_weight_columns`."""
+    types, cum_weights = columns
+    return random.choices(types, cum_weights=cum_weights, k=1)[0]
+
+
+# Column form of each personality's move weights, split once at import
+_MOVE_WEIGHT_COLUMNS = {
+    name: _weight_columns(config.move_weights) for name, config in AGENT_PERSONALITIES.items()
+}
 
 
 def _pick_resource(game_state: GameState, personality: str) -> Resource:
     """Pick a resource — aggressive agents target the richest, defensive protect the most valuable."""
     resources = game_state.resources
     config = AGENT_PERSONALITIES.get(personality, AGENT_PERSONALITIES["adaptive"])
-    if config["risk_tolerance"] > 0.5:
+    if config.risk_tolerance > 0.5:
         target = max(resources, key=resources.get)
-    elif config["risk_tolerance"] < 0.4:
+    elif config.risk_tolerance < 0.4:
         target = min(resources, key=resources.get)
     else:
-        target = random.choice(list(Resource)).value
+        return random.choice(_RESOURCES)
     return Resource(target)
 
 
@@ -313,22 +373,20 @@ def _generate_mock_predictions(
 ) -> PredictionResult:
     """Generate realistic mock predictions based on personality and game state."""
     config = AGENT_PERSONALITIES.get(personality, AGENT_PERSONALITIES["adaptive"])
-    weights = config["move_weights"]
+    weights = _MOVE_WEIGHT_COLUMNS.get(personality, _MOVE_WEIGHT_COLUMNS["adaptive"])
 
     # Determine what we think the opponent will do (influenced by their history)
     opponent_personality_guess = "adaptive"
     if opponent_history:
         last_moves = [h.get("type", "") for h in opponent_history[-3:]]
-        aggressive_count = sum(1 for m in last_moves if "aggressive" in m)
-        defensive_count = sum(1 for m in last_moves if "defensive" in m or "counter" in m)
+        aggressive_count = sum(1 for m in last_moves if m in _AGGRESSIVE_MOVE_TYPES)
+        defensive_count = sum(1 for m in last_moves if m in _DEFENSIVE_MOVE_TYPES)
         if aggressive_count > defensive_count:
             opponent_personality_guess = "aggressive"
         elif defensive_count > aggressive_count:
             opponent_personality_guess = "defensive"
 
-    opponent_weights = AGENT_PERSONALITIES.get(
-        opponent_personality_guess, AGENT_PERSONALITIES["adaptive"]
-    )["move_weights"]
+    opponent_weights = _MOVE_WEIGHT_COLUMNS[opponent_personality_guess]
 
     predictions = []
     for i in range(3):
@@ -347,18 +405,13 @@ def _generate_mock_predictions(
         counter_type = _weighted_choice(weights)
         counter_resource = predicted_resource  # counter the same resource
 
-        reasoning_options = [
-            f"Opponent likely to {predicted_move_type.value} based on recent pattern",
-            f"Historical data suggests {predicted_move_type.value} on {predicted_resource.value}",
-            f"Game state favors opponent playing {predicted_move_type.value}",
-            f"Based on score differential, expect {predicted_move_type.value}",
-        ]
-
         predictions.append({
             "opponentMove": f"{predicted_move_type.value}_{predicted_resource.value}",
             "confidence": conf,
             "counter": f"{counter_type.value}_{counter_resource.value}",
-            "reasoning": random.choice(reasoning_options),
+            "reasoning": random.choice(_PREDICTION_REASONING_TEMPLATES).format(
+                move=predicted_move_type.value, resource=predicted_resource.value
+            ),
         })
 
     # Choose our actual move
@@ -367,7 +420,7 @@ def _generate_mock_predictions(
 
     # Amount influenced by personality
     base_amount = random.randint(30, 80)
-    risk_factor = config["risk_tolerance"]
+    risk_factor = config.risk_tolerance
     amount = min(100, max(20, int(base_amount * (0.5 + risk_factor))))
 
     chosen_move = Move(type=chosen_type, target=chosen_resource, amount=amount)
@@ -376,7 +429,7 @@ def _generate_mock_predictions(
         f"Playing {chosen_type.value} on {chosen_resource.value} to maximize advantage",
         f"Given opponent's likely {predictions[0]['opponentMove']}, best counter is {chosen_type.value}",
         f"Score is {'ahead' if game_state.scores.get(agent_name, 0) > game_state.scores.get('blue' if agent_name == 'red' else 'red', 0) else 'behind'}, adjusting strategy accordingly",
-        f"Round {game_state.round_number} — {'early game aggression' if game_state.round_number <= 3 else 'mid-game adaptation' if game_state.round_number <= 7 else 'end-game push'}",
+        f"Round {game_state.round_number} — {_ROUND_PHASE_LABELS[bisect.bisect_left(_ROUND_PHASE_BOUNDS, game_state.round_number)]}",
     ]
 
     return PredictionResult(
@@ -448,6 +501,9 @@ AUCTION_WEIGHTS: dict[str, dict[AuctionMoveType, float]] = {
     },
 }
 
+_NEGOTIATION_WEIGHT_COLUMNS = {name: _weight_columns(w) for name, w in NEGOTIATION_WEIGHTS.items()}
+_AUCTION_WEIGHT_COLUMNS = {name: _weight_columns(w) for name, w in AUCTION_WEIGHTS.items()}
+
 
 # ---------------------------------------------------------------------------
 # Negotiation prompt builder
@@ -468,19 +524,19 @@ def _build_negotiation_prompt(
 
 GAME: negotiation
 YOUR ROLE: {role}
-YOUR PERSONALITY: {config['description']}
-{config['system_prompt_modifier']}
+YOUR PERSONALITY: {config.description}
+{config.system_prompt_modifier}
 CURRENT ROUND: {game_state.round_number}/{game_state.total_rounds}
 YOUR WALKAWAY PRICE: {game_state.red_walkaway if agent_name == 'red' else game_state.blue_walkaway}
 
 GAME STATE:
-{json.dumps(game_state.to_dict_for_agent(agent_name))}
+{_prompt_json(game_state.to_dict_for_agent(agent_name))}
 
 YOUR MOVE HISTORY:
-{json.dumps(my_history[-5:])}
+{_prompt_json(my_history[-5:])}
 
 OPPONENT'S MOVE HISTORY:
-{json.dumps(opponent_history[-5:])}
+{_prompt_json(opponent_history[-5:])}
 
 VALID MOVE TYPES: propose, accept, reject, counter_offer, bluff_walkaway
 PRICE: integer between 10 and 90
@@ -522,19 +578,19 @@ def _build_auction_prompt(
     base = f"""You are {agent_name}, a competitor in Agent Colosseum.
 
 GAME: auction
-YOUR PERSONALITY: {config['description']}
-{config['system_prompt_modifier']}
+YOUR PERSONALITY: {config.description}
+{config.system_prompt_modifier}
 CURRENT ITEM: {game_state.round_number}/{game_state.total_rounds}
 YOUR CREDITS: {game_state.credits.get(agent_name, 0)}
 
 GAME STATE:
-{json.dumps(game_state.to_dict_for_agent(agent_name))}
+{_prompt_json(game_state.to_dict_for_agent(agent_name))}
 
 YOUR MOVE HISTORY:
-{json.dumps(my_history[-5:])}
+{_prompt_json(my_history[-5:])}
 
 OPPONENT'S MOVE HISTORY:
-{json.dumps(opponent_history[-5:])}
+{_prompt_json(opponent_history[-5:])}
 
 VALID MOVE TYPES: bid, pass, bluff_bid
 AMOUNT: integer (your bid amount, up to your remaining credits)
@@ -562,6 +618,18 @@ Return ONLY valid JSON:
 # Negotiation mock predictions
 # ---------------------------------------------------------------------------
 
+_NEGOTIATION_PREDICTION_TEMPLATES = (
+    "Opponent likely to {move} around {price}",
+    "Based on history, expect {move}",
+    "Score pressure suggests {move}",
+)
+_NEGOTIATION_CHOICE_TEMPLATES = (
+    "Playing {move} at {price} to maximize deal value",
+    "Round {round} strategy: {move}",
+    "Adjusting based on opponent's recent moves",
+)
+
+
 def _generate_negotiation_mock_predictions(
     agent_name: str,
     personality: str,
@@ -571,18 +639,12 @@ def _generate_negotiation_mock_predictions(
 ) -> PredictionResult:
     """Generate mock predictions for the negotiation game."""
     config = AGENT_PERSONALITIES.get(personality, AGENT_PERSONALITIES["adaptive"])
-    weights = NEGOTIATION_WEIGHTS.get(personality, NEGOTIATION_WEIGHTS["adaptive"])
-
-    def _neg_weighted_choice(w: dict) -> NegotiationMoveType:
-        types = list(w.keys())
-        probs = list(w.values())
-        return random.choices(types, weights=probs, k=1)[0]
-
-    opp_weights = NEGOTIATION_WEIGHTS.get("adaptive")
+    weights = _NEGOTIATION_WEIGHT_COLUMNS.get(personality, _NEGOTIATION_WEIGHT_COLUMNS["adaptive"])
+    opp_weights = _NEGOTIATION_WEIGHT_COLUMNS["adaptive"]
 
     predictions = []
     for i in range(3):
-        pred_type = _neg_weighted_choice(opp_weights)
+        pred_type = _weighted_choice(opp_weights)
         pred_price = random.randint(20, 80)
         if i == 0:
             conf = round(random.uniform(0.45, 0.70), 2)
@@ -591,27 +653,25 @@ def _generate_negotiation_mock_predictions(
         else:
             conf = round(max(0.05, 1.0 - sum(p["confidence"] for p in predictions)), 2)
 
-        counter_type = _neg_weighted_choice(weights)
+        counter_type = _weighted_choice(weights)
         counter_price = random.randint(20, 80)
 
         predictions.append({
             "opponentMove": f"{pred_type.value}_{pred_price}",
             "confidence": conf,
             "counter": f"{counter_type.value}_{counter_price}",
-            "reasoning": random.choice([
-                f"Opponent likely to {pred_type.value} around {pred_price}",
-                f"Based on history, expect {pred_type.value}",
-                f"Score pressure suggests {pred_type.value}",
-            ]),
+            "reasoning": random.choice(_NEGOTIATION_PREDICTION_TEMPLATES).format(
+                move=pred_type.value, price=pred_price
+            ),
         })
 
     # Choose our move
-    chosen_type = _neg_weighted_choice(weights)
+    chosen_type = _weighted_choice(weights)
 
     # Price strategy based on role and personality
     is_seller = agent_name == "red"
     walkaway = game_state.red_walkaway if is_seller else game_state.blue_walkaway
-    risk = config["risk_tolerance"]
+    risk = config.risk_tolerance
 
     if is_seller:
         # Seller wants high price
@@ -631,11 +691,9 @@ def _generate_negotiation_mock_predictions(
     return PredictionResult(
         predictions=predictions,
         chosen_move=chosen_move,
-        reasoning=random.choice([
-            f"Playing {chosen_type.value} at {price} to maximize deal value",
-            f"Round {game_state.round_number} strategy: {chosen_type.value}",
-            f"Adjusting based on opponent's recent moves",
-        ]),
+        reasoning=random.choice(_NEGOTIATION_CHOICE_TEMPLATES).format(
+            move=chosen_type.value, price=price, round=game_state.round_number
+        ),
     )
 
 
@@ -643,6 +701,18 @@ def _generate_negotiation_mock_predictions(
 # Auction mock predictions
 # ---------------------------------------------------------------------------
 
+_AUCTION_PREDICTION_TEMPLATES = (
+    "Opponent likely to {move} around {amount}",
+    "Item value suggests opponent bids {amount}",
+    "Credits remaining favor {move}",
+)
+_AUCTION_CHOICE_TEMPLATES = (
+    "Bidding {amount} on {item} (valued at {valuation})",
+    "Round {round}: {move} strategy with {credits} credits left",
+    "Risk-adjusted bid based on remaining items",
+)
+
+
 def _generate_auction_mock_predictions(
     agent_name: str,
     personality: str,
@@ -652,23 +722,18 @@ def _generate_auction_mock_predictions(
 ) -> PredictionResult:
     """Generate mock predictions for the auction game."""
     config = AGENT_PERSONALITIES.get(personality, AGENT_PERSONALITIES["adaptive"])
-    weights = AUCTION_WEIGHTS.get(personality, AUCTION_WEIGHTS["adaptive"])
-
-    def _auc_weighted_choice(w: dict) -> AuctionMoveType:
-        types = list(w.keys())
-        probs = list(w.values())
-        return random.choices(types, weights=probs, k=1)[0]
+    weights = _AUCTION_WEIGHT_COLUMNS.get(personality, _AUCTION_WEIGHT_COLUMNS["adaptive"])
 
     current_item = game_state.current_item()
     my_valuation = 0
     if current_item:
         my_valuation = current_item.red_valuation if agent_name == "red" else current_item.blue_valuation
 
-    opp_weights = AUCTION_WEIGHTS.get("adaptive")
+    opp_weights = _AUCTION_WEIGHT_COLUMNS["adaptive"]
 
     predictions = []
     for i in range(3):
-        pred_type = _auc_weighted_choice(opp_weights)
+        pred_type = _weighted_choice(opp_weights)
         pred_amount = random.randint(20, 200) if pred_type != AuctionMoveType.PASS else 0
         if i == 0:
             conf = round(random.uniform(0.45, 0.70), 2)
@@ -677,23 +742,21 @@ def _generate_auction_mock_predictions(
         else:
             conf = round(max(0.05, 1.0 - sum(p["confidence"] for p in predictions)), 2)
 
-        counter_type = _auc_weighted_choice(weights)
+        counter_type = _weighted_choice(weights)
         counter_amount = random.randint(20, 200) if counter_type != AuctionMoveType.PASS else 0
 
         predictions.append({
             "opponentMove": f"{pred_type.value}_{pred_amount}",
             "confidence": conf,
             "counter": f"{counter_type.value}_{counter_amount}",
-            "reasoning": random.choice([
-                f"Opponent likely to {pred_type.value} around {pred_amount}",
-                f"Item value suggests opponent bids {pred_amount}",
-                f"Credits remaining favor {pred_type.value}",
-            ]),
+            "reasoning": random.choice(_AUCTION_PREDICTION_TEMPLATES).format(
+                move=pred_type.value, amount=pred_amount
+            ),
         })
 
     # Choose our move
-    chosen_type = _auc_weighted_choice(weights)
-    risk = config["risk_tolerance"]
+    chosen_type = _weighted_choice(weights)
+    risk = config.risk_tolerance
     credits_available = game_state.credits.get(agent_name, 0)
 
     if chosen_type == AuctionMoveType.PASS:
@@ -708,18 +771,137 @@ def _generate_auction_mock_predictions(
     return PredictionResult(
         predictions=predictions,
         chosen_move=chosen_move,
-        reasoning=random.choice([
-            f"Bidding {amount} on {current_item.name if current_item else 'item'} (valued at {my_valuation})",
-            f"Round {game_state.round_number}: {chosen_type.value} strategy with {credits_available} credits left",
-            f"Risk-adjusted bid based on remaining items",
-        ]),
+        reasoning=random.choice(_AUCTION_CHOICE_TEMPLATES).format(
+            amount=amount,
+            item=current_item.name if current_item else "item",
+            valuation=my_valuation,
+            round=game_state.round_number,
+            move=chosen_type.value,
+            credits=credits_available,
+        ),
     )
 
 
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _parse_llm_json(content: str) -> dict:
+    """Decode the JSON object in an LLM reply.
+
+    A markdown code fence, if present, is unwrapped first. The span from the
+    first '{' to the last '}' is then handed to orjson; if stray text makes
+    that span invalid, raw_decode is tried from each '{' in turn so braces in
+    surrounding prose are skipped.
+    """
+    if "```" in content:
+        _, _, fenced = content.partition("```")
+        if fenced.startswith("json"):
+            fenced = fenced[4:]
+        content = fenced.partition("```")[0]
+    start = content.find("{")
+    if start < 0:
+        raise ValueError("No JSON object in model response")
+    try:
+        return orjson.loads(content[start:content.rfind("}") + 1])
+    except orjson.JSONDecodeError:
+        pass
+    while True:
+        try:
+            parsed, _ = _JSON_DECODER.raw_decode(content, start)
+            return parsed
+        except json.JSONDecodeError:
+            start = content.find("{", start + 1)
+            if start < 0:
+                raise
+
+
+async def iter_event_stream(stream):
+    """Iterate a blocking botocore EventStream from a worker thread.
+
+    Yields events as they arrive so the event loop keeps serving other
+    matches while Bedrock is still generating tokens. If the consumer stops
+    early (e.g. an SSE client disconnects), the stream is closed and the
+    worker thread exits instead of draining the rest of the response.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    done = object()
+    stop = threading.Event()
+
+    def _pump() -> None:
+        try:
+            for event in stream:
+                if stop.is_set():
+                    return
+                loop.call_soon_threadsafe(queue.put_nowait, event)
+        except Exception as e:
+            if not stop.is_set():
+                loop.call_soon_threadsafe(queue.put_nowait, e)
+        finally:
+            if not stop.is_set():
+                loop.call_soon_threadsafe(queue.put_nowait, done)
+
+    pump = asyncio.ensure_future(asyncio.to_thread(_pump))
+    exhausted = False
+    try:
+        while True:
+            item = await queue.get()
+            if item is done:
+                exhausted = True
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        if not exhausted:
+            stop.set()
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()
+    await pump
+
+
+_bedrock_client: Any = None
+_bedrock_client_lock = threading.Lock()
+
+
+def get_bedrock_client():
+    """Return the process-wide Bedrock runtime client, creating it on first use.
+
+    boto3 clients are thread-safe, so one pooled client is shared by every
+    agent in every match instead of paying client setup and TLS handshakes
+    per AgentPredictor.
+    """
+    global _bedrock_client
+    if _bedrock_client is not None:
+        return _bedrock_client
+    with _bedrock_client_lock:
+        if _bedrock_client is None:
+            import boto3
+            from botocore.config import Config
+
+            region = os.getenv("AWS_REGION", os.getenv("AWS_DEFAULT_REGION", "us-west-2"))
+            _bedrock_client = boto3.client(
+                "bedrock-runtime",
+                region_name=region,
+                aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+                aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+                aws_session_token=os.getenv("AWS_SESSION_TOKEN"),
+                config=Config(
+                    max_pool_connections=int(os.getenv("BEDROCK_MAX_POOL_CONNECTIONS", "50")),
+                    tcp_keepalive=True,
+                ),
+            )
+    return _bedrock_client
+
+
 # ---------------------------------------------------------------------------
 # AgentPredictor — main class
 # ---------------------------------------------------------------------------
 
+_PATTERN_CACHE_TTL = 30.0  # seconds
+
+
 class AgentPredictor:
     """Prediction engine for a single agent. Supports Bedrock and mock modes."""
 
@@ -733,24 +915,21 @@ class AgentPredictor:
     ):
         self.agent_name = agent_name
         self.personality = personality
+        # Resolved once; the personality is fixed for the predictor's lifetime
+        self.config = AGENT_PERSONALITIES.get(personality, AGENT_PERSONALITIES["adaptive"])
         self.game_type = game_type
         self.mock_mode = os.getenv("MOCK_MODE", "false").lower() == "true"
+        self.model_id = os.getenv("BEDROCK_MODEL_ID", "us.anthropic.claude-sonnet-4-5-20250929-v1:0")
         self._bedrock_client = None
         self.neo4j_client = neo4j_client
         self.metrics = metrics
+        # opponent_personality -> (fetched_at, patterns); the graph changes slowly
+        self._pattern_cache: dict[str, tuple[float, list[str]]] = {}
 
     def _get_bedrock_client(self):
         if self._bedrock_client is None:
             try:
-                import boto3
-                region = os.getenv("AWS_REGION", os.getenv("AWS_DEFAULT_REGION", "us-west-2"))
-                self._bedrock_client = boto3.client(
-                    "bedrock-runtime",
-                    region_name=region,
-                    aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-                    aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-                    aws_session_token=os.getenv("AWS_SESSION_TOKEN"),
-                )
+                self._bedrock_client = get_bedrock_client()
             except Exception as e:
                 logger.warning("Bedrock client init failed, falling back to mock: %s", e)
                 self.mock_mode = True
@@ -842,31 +1021,39 @@ class AgentPredictor:
         )
 
     async def _get_neo4j_patterns(self, opponent_personality: str) -> list[str]:
-        """Fetch counter-strategy patterns from Neo4j for the given opponent personality."""
+        """Fetch counter-strategy patterns from Neo4j for the given opponent personality.
+
+        Successful lookups, including empty ones, are reused for
+        _PATTERN_CACHE_TTL seconds, so a match does not re-run the same graph
+        query every round. Timeouts and errors are not cached.
+        """
         if self.neo4j_client is None:
             return []
+        cached = self._pattern_cache.get(opponent_personality)
+        if cached is not None and time.monotonic() - cached[0] < _PATTERN_CACHE_TTL:
+            return cached[1]
         try:
-            # Check which method exists on the client
-            method = None
-            if hasattr(self.neo4j_client, 'get_counter_strategies'):
-                method = self.neo4j_client.get_counter_strategies
-            elif hasattr(self.neo4j_client, 'get_counter_strategy'):
-                method = self.neo4j_client.get_counter_strategy
+            method = getattr(self.neo4j_client, "get_counter_strategies", None)
             if method is None:
                 return []
+            # The client is built on the async Neo4j driver: await the query on
+            # the event loop rather than handing the coroutine function to a thread.
             patterns = await asyncio.wait_for(
-                asyncio.to_thread(method, self.agent_name, opponent_personality),
+                method(self.agent_name, opponent_personality),
                 timeout=0.5,
             )
-            # Normalize: patterns may be list of strings or list of dicts
-            if not patterns:
+            if patterns is None:
+                # The client swallowed a driver error; don't cache the outage
                 return []
+            # Normalize: patterns may be list of strings or list of dicts.
+            # An empty result is a successful lookup and is cached too.
             result = []
             for p in patterns:
                 if isinstance(p, str):
                     result.append(p)
                 elif isinstance(p, dict):
                     result.append(str(p.get('pattern') or p.get('description') or p))
+            self._pattern_cache[opponent_personality] = (time.monotonic(), result)
             return result
         except Exception as e:
             logger.debug("Neo4j pattern fetch failed: %s", e)
@@ -900,8 +1087,8 @@ class AgentPredictor:
         client = self._get_bedrock_client()
         if client is None:
             return await self._predict_mock(game_state, opponent_history, my_history)
-        model_id = os.getenv("BEDROCK_MODEL_ID", "us.anthropic.claude-sonnet-4-5-20250929-v1:0")
-        config = AGENT_PERSONALITIES.get(self.personality, AGENT_PERSONALITIES["adaptive"])
+        model_id = self.model_id
+        config = self.config
 
         intelligence_context = await self._fetch_intelligence_context(opponent_personality)
         prompt = self._build_prompt(
@@ -940,12 +1127,12 @@ class AgentPredictor:
                         body=json.dumps({
                             "anthropic_version": "bedrock-2023-05-31",
                             "max_tokens": 1024,
-                            "temperature": config["temperature"],
+                            "temperature": config.temperature,
                             "messages": [{"role": "user", "content": prompt}],
                         }),
                     )
 
-                    body = json.loads(response["body"].read())
+                    body = orjson.loads(response["body"].read())
                     content = body.get("content", [{}])[0].get("text", "{}")
 
                     # Extract token usage from Bedrock response
@@ -972,12 +1159,7 @@ class AgentPredictor:
                     pass
 
                 # Parse JSON from response (handle markdown code blocks)
-                if "```json" in content:
-                    content = content.split("```json")[1].split("```")[0]
-                elif "```" in content:
-                    content = content.split("```")[1].split("```")[0]
-
-                parsed = json.loads(content.strip())
+                parsed = _parse_llm_json(content)
                 chosen_move = self._parse_chosen_move(parsed)
 
                 result = PredictionResult(
@@ -1024,8 +1206,8 @@ class AgentPredictor:
                 yield {"type": "prediction_branch", "index": i, "prediction": pred}
             yield {"type": "prediction_complete", "result": result}
             return
-        model_id = os.getenv("BEDROCK_MODEL_ID", "us.anthropic.claude-sonnet-4-5-20250929-v1:0")
-        config = AGENT_PERSONALITIES.get(self.personality, AGENT_PERSONALITIES["adaptive"])
+        model_id = self.model_id
+        config = self.config
 
         prompt = self._build_prompt(game_state, my_history, opponent_history)
 
@@ -1047,19 +1229,19 @@ class AgentPredictor:
                     body=json.dumps({
                         "anthropic_version": "bedrock-2023-05-31",
                         "max_tokens": 1024,
-                        "temperature": config["temperature"],
+                        "temperature": config.temperature,
                         "messages": [{"role": "user", "content": prompt}],
                     }),
                 )
 
-                full_text = ""
+                text_parts: list[str] = []
                 input_tokens = 0
                 output_tokens = 0
-                for event in response["body"]:
-                    chunk = json.loads(event["chunk"]["bytes"])
+                async for event in iter_event_stream(response["body"]):
+                    chunk = orjson.loads(event["chunk"]["bytes"])
                     if chunk.get("type") == "content_block_delta":
                         delta = chunk.get("delta", {}).get("text", "")
-                        full_text += delta
+                        text_parts.append(delta)
                         yield {"type": "stream_chunk", "text": delta}
                     # message_start carries input token count
                     if chunk.get("type") == "message_start":
@@ -1071,12 +1253,8 @@ class AgentPredictor:
                         output_tokens = usage.get("output_tokens", 0)
 
                 # Parse final result
-                if "```json" in full_text:
-                    full_text = full_text.split("```json")[1].split("```")[0]
-                elif "```" in full_text:
-                    full_text = full_text.split("```")[1].split("```")[0]
-
-                parsed = json.loads(full_text.strip())
+                full_text = "".join(text_parts)
+                parsed = _parse_llm_json(full_text)
                 chosen_move = self._parse_chosen_move(parsed)
 
                 result = PredictionResult(
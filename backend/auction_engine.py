@@ -20,7 +20,7 @@ TOTAL_ITEMS = 8
 STARTING_CREDITS = 1000
 
 
-@dataclass
+@dataclass(slots=True)
 class AuctionMove:
     type: AuctionMoveType
     amount: int = 0  # bid amount (0 for pass)
@@ -54,25 +54,31 @@ class AuctionItem:
         return d
 
 
+# (name, public base value) for each of the TOTAL_ITEMS lots, in auction order
+_ITEM_TEMPLATES: tuple[tuple[str, int], ...] = (
+    ("Alpha Core", 100),
+    ("Beta Shield", 80),
+    ("Gamma Drive", 120),
+    ("Delta Array", 90),
+    ("Epsilon Node", 110),
+    ("Zeta Link", 70),
+    ("Eta Pulse", 130),
+    ("Theta Grid", 95),
+)
+
+
 def _generate_items() -> list[AuctionItem]:
     """Generate 8 auction items with varied valuations."""
-    item_templates = [
-        ("Alpha Core", 100),
-        ("Beta Shield", 80),
-        ("Gamma Drive", 120),
-        ("Delta Array", 90),
-        ("Epsilon Node", 110),
-        ("Zeta Link", 70),
-        ("Eta Pulse", 130),
-        ("Theta Grid", 95),
+    # Each agent has a private valuation that varies from the base
+    return [
+        AuctionItem(
+            name=name,
+            base_value=base,
+            red_valuation=base + random.randint(-30, 50),
+            blue_valuation=base + random.randint(-30, 50),
+        )
+        for name, base in _ITEM_TEMPLATES
     ]
-    items = []
-    for name, base in item_templates:
-        # Each agent has a private valuation that varies from the base
-        red_val = base + random.randint(-30, 50)
-        blue_val = base + random.randint(-30, 50)
-        items.append(AuctionItem(name=name, base_value=base, red_valuation=red_val, blue_valuation=blue_val))
-    return items
 
 
 @dataclass
@@ -147,7 +153,7 @@ class AuctionState:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AuctionRoundResolution:
     round_winner: Optional[str]
     item_name: str = ""
@@ -171,14 +177,14 @@ def get_valid_moves(game_state: AuctionState) -> list[dict]:
     if not current:
         return moves
 
-    # Bid amounts in increments, capped by available credits
-    for agent in ["red", "blue"]:
-        max_bid = game_state.credits[agent]
-        for amount in range(10, min(max_bid + 1, 501), 10):
-            moves.append({"type": "bid", "amount": amount})
-        # Bluff bid (will be revealed as a bluff -- bid is halved)
-        for amount in range(50, min(max_bid + 1, 501), 50):
-            moves.append({"type": "bluff_bid", "amount": amount})
+    # Bid amounts in increments, capped by the larger credit balance so
+    # each amount appears once rather than once per agent
+    max_bid = max(game_state.credits["red"], game_state.credits["blue"])
+    for amount in range(10, min(max_bid + 1, 501), 10):
+        moves.append({"type": "bid", "amount": amount})
+    # Bluff bid (will be revealed as a bluff -- bid is halved)
+    for amount in range(50, min(max_bid + 1, 501), 50):
+        moves.append({"type": "bluff_bid", "amount": amount})
 
     return moves
 
@@ -297,12 +303,10 @@ def resolve_round(
 
 def is_game_over(game_state: AuctionState) -> bool:
     """Game over when all items have been auctioned."""
-    if game_state.round_number > game_state.total_rounds:
-        return True
     # Also end if both agents are out of credits
-    if game_state.credits["red"] <= 0 and game_state.credits["blue"] <= 0:
-        return True
-    return False
+    return game_state.round_number > game_state.total_rounds or (
+        game_state.credits["red"] <= 0 and game_state.credits["blue"] <= 0
+    )
 
 
 def get_winner(game_state: AuctionState) -> str:
@@ -14,6 +14,7 @@ The module exposes:
 
 from __future__ import annotations
 
+import functools
 import logging
 from typing import Any, Optional
 
@@ -63,8 +64,9 @@ def set_match_store(store: dict[str, dict[str, Any]]) -> None:
 # We import these at function-call time to avoid circular import issues
 # and to make the module importable even when copilotkit_runtime isn't wired yet.
 
+@functools.lru_cache(maxsize=1)
 def _get_helpers():
-    """Lazily import helper functions from copilotkit_runtime."""
+    """Lazily import helper functions from copilotkit_runtime (resolved once, then cached)."""
     from backend.copilotkit_runtime import (  # type: ignore
         _find_current_match,
         _build_agent_state,
@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import hashlib
 import json
 import logging
 import os
+import re
+import threading
 import uuid
+from collections import OrderedDict, deque
+from contextlib import aclosing
 from typing import Any
 
+import orjson
 from fastapi import APIRouter, Request
 from fastapi.responses import StreamingResponse
 
@@ -49,39 +56,47 @@ def set_match_store(store: dict[str, dict[str, Any]]) -> None:
 
 def _find_current_match() -> tuple[str | None, dict]:
     """Find the most recent running or completed match and return (match_id, data)."""
-    for mid, data in reversed(list(_match_store.items())):
+    # Walk the dict view newest-first and stop at the first hit, without copying the store
+    for mid, data in reversed(_match_store.items()):
         if data.get("state") in ("running", "completed"):
             return mid, data
     return None, {}
 
 
-def _get_round_ends(events: list[dict]) -> list[dict]:
-    """Extract all round_end events."""
-    return [e for e in events if e.get("type") == "round_end"]
-
-
-def _get_match_end(events: list[dict]) -> dict | None:
-    """Extract the match_end event if present."""
-    for e in reversed(events):
-        if e.get("type") == "match_end":
-            return e
-    return None
+def _split_events(events: list[dict]) -> tuple[list[dict], dict | None]:
+    """Collect round_end events and the last match_end event in a single pass."""
+    round_ends: list[dict] = []
+    match_end = None
+    for e in events:
+        etype = e.get("type")
+        if etype == "round_end":
+            round_ends.append(e)
+        elif etype == "match_end":
+            match_end = e
+    return round_ends, match_end
 
 
 # ---------------------------------------------------------------------------
 # Agent state builder -- analyzes match data to build rich state
 # ---------------------------------------------------------------------------
 
+# Personality lookups, built once. Keys are the AGENT_PERSONALITIES names in
+# agent.py plus "balanced", a style the frontend also has a colour for.
+_KNOWN_STYLES = frozenset({"aggressive", "defensive", "balanced", "chaotic", "adaptive"})
+_PERSONALITY_TACTICS = {
+    "aggressive": "high-risk bluffing",
+    "defensive": "counter-play exploitation",
+    "balanced": "calculated positioning",
+    "chaotic": "unpredictable chaos",
+    "adaptive": "pattern exploitation",
+}
+_PERSONALITY_BASE_RISK = {"aggressive": 0.8, "defensive": 0.3, "balanced": 0.5, "chaotic": 0.6, "adaptive": 0.5}
+
+
 def _infer_style(personality: str) -> str:
     """Map personality name to a style label."""
-    mapping = {
-        "aggressive": "aggressive",
-        "defensive": "defensive",
-        "balanced": "balanced",
-        "random": "chaotic",
-        "adaptive": "adaptive",
-    }
-    return mapping.get(personality.lower(), personality)
+    style = personality.lower()
+    return style if style in _KNOWN_STYLES else personality
 
 
 def _infer_tactic(personality: str, recent_rounds: list[dict], agent: str) -> str:
@@ -102,20 +117,12 @@ def _infer_tactic(personality: str, recent_rounds: list[dict], agent: str) -> st
         elif trend < -3:
             return "damage control"
 
-    tactics = {
-        "aggressive": "high-risk bluffing",
-        "defensive": "counter-play exploitation",
-        "balanced": "calculated positioning",
-        "random": "unpredictable chaos",
-        "adaptive": "pattern exploitation",
-    }
-    return tactics.get(personality.lower(), f"{personality} tactics")
+    return _PERSONALITY_TACTICS.get(personality.lower(), f"{personality} tactics")
 
 
 def _compute_risk_level(personality: str, recent_rounds: list[dict], agent: str) -> float:
     """Compute a risk level 0-1 based on personality and recent accuracy."""
-    base = {"aggressive": 0.8, "defensive": 0.3, "balanced": 0.5, "random": 0.6, "adaptive": 0.5}
-    risk = base.get(personality.lower(), 0.5)
+    risk = _PERSONALITY_BASE_RISK.get(personality.lower(), 0.5)
 
     # Adjust based on recent accuracy -- low accuracy means higher risk
     if recent_rounds:
@@ -131,13 +138,15 @@ def _compute_risk_level(personality: str, recent_rounds: list[dict], agent: str)
     return round(risk, 2)
 
 
-def _compute_prediction_trends(round_ends: list[dict], agent: str) -> list[float]:
-    """Build a list of prediction accuracy values per round for an agent."""
-    trends = []
+def _compute_prediction_trends(round_ends: list[dict]) -> dict[str, list[float]]:
+    """Build per-round prediction accuracy lists for both agents in one pass."""
+    red: list[float] = []
+    blue: list[float] = []
     for r in round_ends:
         acc = r.get("accuracy", {})
-        trends.append(round(acc.get(agent, 0.0), 2))
-    return trends
+        red.append(round(acc.get("red", 0.0), 2))
+        blue.append(round(acc.get("blue", 0.0), 2))
+    return {"red": red, "blue": blue}
 
 
 def _determine_momentum(round_ends: list[dict]) -> dict:
@@ -173,7 +182,7 @@ def _determine_momentum(round_ends: list[dict]) -> dict:
 
 def _find_key_moments(round_ends: list[dict]) -> list[dict]:
     """Identify key moments in the match: big score swings, perfect predictions, lead changes."""
-    moments = []
+    moments: deque[dict] = deque(maxlen=5)  # Keep last 5 moments
     prev_leader = None
 
     for r in round_ends:
@@ -194,7 +203,7 @@ def _find_key_moments(round_ends: list[dict]) -> list[dict]:
             if accuracy.get(agent, 0) >= 0.95:
                 moments.append({"round": rnd, "event": f"{agent.capitalize()} perfect prediction", "impact": "medium"})
 
-    return moments[-5:]  # Keep last 5 moments
+    return list(moments)
 
 
 def _build_agent_state(match_id: str | None, data: dict) -> dict:
@@ -214,8 +223,7 @@ def _build_agent_state(match_id: str | None, data: dict) -> dict:
 
     config = data.get("config", {})
     events = data.get("events", [])
-    round_ends = _get_round_ends(events)
-    match_end = _get_match_end(events)
+    round_ends, match_end = _split_events(events)
 
     red_personality = config.get("red_personality", "aggressive")
     blue_personality = config.get("blue_personality", "defensive")
@@ -238,10 +246,7 @@ def _build_agent_state(match_id: str | None, data: dict) -> dict:
             },
         },
         "momentum": _determine_momentum(round_ends),
-        "predictionTrends": {
-            "red": _compute_prediction_trends(round_ends, "red"),
-            "blue": _compute_prediction_trends(round_ends, "blue"),
-        },
+        "predictionTrends": _compute_prediction_trends(round_ends),
         "keyMoments": _find_key_moments(round_ends),
         "currentInsight": "",
         "matchProgress": {
@@ -258,7 +263,7 @@ def _build_agent_state(match_id: str | None, data: dict) -> dict:
 
 def _build_commentary_prompt(user_message: str, agent_state: dict) -> str:
     """Build a prompt for the arena commentator."""
-    state_desc = json.dumps(agent_state, indent=2, default=str)
+    state_desc = json.dumps(agent_state, separators=(",", ":"), default=str)
     return (
         "You are the Arena Commentator for Agent Colosseum, an AI-vs-AI battle arena. "
         "Your job is to provide exciting, insightful commentary about the matches. "
@@ -269,6 +274,27 @@ def _build_commentary_prompt(user_message: str, agent_state: dict) -> str:
     )
 
 
+_ANALYSIS_KEYWORDS = ("performance", "analyze", "analysis", "stats", "summary")
+# One pattern finds both "round <n>" lookups and analysis keywords in a single scan
+_QUESTION_RE = re.compile(
+    r"round\D*?(?P<round>\d+)|(?P<analysis>" + "|".join(map(re.escape, _ANALYSIS_KEYWORDS)) + ")"
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _classify_question(lower_msg: str) -> tuple[str, int | None]:
+    """Classify a lowercased user question as a round lookup, an analysis request, or general chat.
+
+    CopilotKit sends the same handful of questions over and over, so results are cached.
+    """
+    intent = "general"
+    for match in _QUESTION_RE.finditer(lower_msg):
+        if match.lastgroup == "round":
+            return "round", int(match.group("round"))
+        intent = "analysis"
+    return intent, None
+
+
 def _generate_mock_commentary(user_message: str, agent_state: dict) -> str:
     """Generate commentary without Bedrock (mock mode)."""
     progress = agent_state.get("matchProgress", {})
@@ -290,18 +316,12 @@ def _generate_mock_commentary(user_message: str, agent_state: dict) -> str:
     red_tactic = strategy.get("red", {}).get("currentTactic", "unknown")
     blue_tactic = strategy.get("blue", {}).get("currentTactic", "unknown")
 
-    # Check if user is asking about a specific round
-    lower_msg = user_message.lower()
-    if "round" in lower_msg:
-        for word in lower_msg.split():
-            if word.isdigit():
-                round_num = int(word)
-                match_id, data = _find_current_match()
-                if match_id:
-                    return _explain_round(match_id, round_num, data)
-
-    # Check if user is asking for analysis
-    if any(kw in lower_msg for kw in ("performance", "analyze", "analysis", "stats", "summary")):
+    intent, round_num = _classify_question(user_message.strip().lower())
+    if intent == "round":
+        match_id, data = _find_current_match()
+        if match_id:
+            return _explain_round(match_id, round_num, data)
+    elif intent == "analysis":
         match_id, data = _find_current_match()
         if match_id:
             return _analyze_performance(match_id, data)
@@ -357,11 +377,9 @@ def _analyze_performance(match_id: str, data: dict | None = None) -> str:
     if not data:
         return f"Match {match_id} not found."
 
-    events = data.get("events", [])
-    match_end = _get_match_end(events)
+    round_ends, match_end = _split_events(data.get("events", []))
 
     if not match_end:
-        round_ends = _get_round_ends(events)
         if not round_ends:
             return "Match has not started yet."
         latest = round_ends[-1]
@@ -383,29 +401,151 @@ def _analyze_performance(match_id: str, data: dict | None = None) -> str:
     return analysis
 
 
+_COMMENTARY_CACHE_SIZE = 128
+_commentary_cache: OrderedDict[str, str] = OrderedDict()
+_commentary_cache_lock = threading.Lock()
+_QUESTION_NOISE_RE = re.compile(r"[^\w\s]+")
+
+
+def _commentary_cache_key(model_id: str, user_message: str, agent_state: dict) -> str:
+    """Cache key for a commentary request.
+
+    The question is casefolded with punctuation and extra whitespace dropped, so
+    "What's happening?" and "whats happening" share an entry for the same match state.
+    """
+    question = " ".join(_QUESTION_NOISE_RE.sub("", user_message.casefold()).split())
+    state = json.dumps(agent_state, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(f"{model_id}\n{question}\n{state}".encode()).hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def _mock_mode() -> bool:
+    """MOCK_MODE, read once on first use (after main.py has loaded .env)."""
+    return os.getenv("MOCK_MODE", "true").lower() == "true"
+
+
+@functools.lru_cache(maxsize=1)
+def _commentary_model_id() -> str:
+    """Model for commentary: BEDROCK_COMMENTARY_MODEL_ID (e.g. a small, fast model), else BEDROCK_MODEL_ID."""
+    return os.getenv("BEDROCK_COMMENTARY_MODEL_ID") or os.getenv(
+        "BEDROCK_MODEL_ID", "anthropic.claude-3-haiku-20240307-v1:0"
+    )
+
+
+def _get_cached_commentary(cache_key: str) -> str | None:
+    with _commentary_cache_lock:
+        cached = _commentary_cache.get(cache_key)
+        if cached is not None:
+            _commentary_cache.move_to_end(cache_key)
+        return cached
+
+
+def _store_commentary(cache_key: str, text: str) -> None:
+    with _commentary_cache_lock:
+        _commentary_cache[cache_key] = text
+        if len(_commentary_cache) > _COMMENTARY_CACHE_SIZE:
+            _commentary_cache.popitem(last=False)
+
+
+def _commentary_request_body(prompt: str) -> str:
+    return json.dumps({
+        "anthropic_version": "bedrock-2023-05-31",
+        "max_tokens": 512,
+        "messages": [{"role": "user", "content": prompt}],
+    })
+
+
 def _generate_bedrock_commentary(user_message: str, agent_state: dict) -> str:
-    """Generate commentary using AWS Bedrock."""
+    """Generate commentary using AWS Bedrock.
+
+    Responses are cached by model, normalized question and match state: repeated
+    questions about an unchanged match skip the Bedrock round-trip entirely.
+    """
     try:
-        import boto3
-        client = boto3.client("bedrock-runtime", region_name=os.getenv("AWS_REGION", "us-east-1"))
+        from backend.agent import get_bedrock_client
+        model_id = _commentary_model_id()
+        cache_key = _commentary_cache_key(model_id, user_message, agent_state)
+        cached = _get_cached_commentary(cache_key)
+        if cached is not None:
+            return cached
+
         prompt = _build_commentary_prompt(user_message, agent_state)
+        client = get_bedrock_client()
         response = client.invoke_model(
-            modelId=os.getenv("BEDROCK_MODEL_ID", "anthropic.claude-3-haiku-20240307-v1:0"),
+            modelId=model_id,
             contentType="application/json",
             accept="application/json",
-            body=json.dumps({
-                "anthropic_version": "bedrock-2023-05-31",
-                "max_tokens": 512,
-                "messages": [{"role": "user", "content": prompt}],
-            }),
+            body=_commentary_request_body(prompt),
         )
-        result = json.loads(response["body"].read())
-        return result.get("content", [{}])[0].get("text", "No commentary generated.")
+        result = orjson.loads(response["body"].read())
+        text = result.get("content", [{}])[0].get("text", "No commentary generated.")
+        _store_commentary(cache_key, text)
+        return text
     except Exception as e:
         logger.warning("Bedrock call failed, falling back to mock: %s", e)
         return _generate_mock_commentary(user_message, agent_state)
 
 
+async def _stream_commentary(user_message: str, agent_state: dict):
+    """Yield commentary text as it is generated.
+
+    Bedrock output is streamed token by token, so the first words reach the
+    client while the rest is still being generated. Mock mode, cache hits and
+    failures before the first token yield the full text in paced word chunks.
+    """
+    async def _paced(text: str):
+        for chunk in _chunk_text(text, 12):
+            yield chunk
+            await asyncio.sleep(0.03)
+
+    if _mock_mode():
+        async for chunk in _paced(_generate_mock_commentary(user_message, agent_state)):
+            yield chunk
+        return
+
+    text_parts: list[str] = []
+    try:
+        from backend.agent import get_bedrock_client, iter_event_stream
+        model_id = _commentary_model_id()
+        cache_key = _commentary_cache_key(model_id, user_message, agent_state)
+        cached = _get_cached_commentary(cache_key)
+        if cached is not None:
+            async for chunk in _paced(cached):
+                yield chunk
+            return
+
+        prompt = _build_commentary_prompt(user_message, agent_state)
+        client = get_bedrock_client()
+        response = await asyncio.to_thread(
+            client.invoke_model_with_response_stream,
+            modelId=model_id,
+            contentType="application/json",
+            body=_commentary_request_body(prompt),
+        )
+        # aclosing: if this generator is closed mid-stream (client disconnect),
+        # the Bedrock stream and its reader thread are shut down right away.
+        async with aclosing(iter_event_stream(response["body"])) as events:
+            async for event in events:
+                chunk = orjson.loads(event["chunk"]["bytes"])
+                if chunk.get("type") == "content_block_delta":
+                    delta = chunk.get("delta", {}).get("text", "")
+                    if delta:
+                        text_parts.append(delta)
+                        yield delta
+    except Exception as e:
+        if text_parts:
+            # Already-sent text can't be retracted; end the message where the stream broke.
+            logger.warning("Bedrock commentary stream interrupted: %s", e)
+            return
+        logger.warning("Bedrock call failed, falling back to mock: %s", e)
+        async for chunk in _paced(_generate_mock_commentary(user_message, agent_state)):
+            yield chunk
+        return
+
+    if text_parts:
+        _store_commentary(cache_key, "".join(text_parts))
+
+
 def _extract_user_message(messages: list) -> str:
     """Pull the latest user message from the AG-UI messages list."""
     if messages:
@@ -420,8 +560,7 @@ def _extract_user_message(messages: list) -> str:
 
 def _generate_commentary(user_message: str, agent_state: dict) -> str:
     """Generate commentary using Bedrock or mock mode."""
-    mock_mode = os.getenv("MOCK_MODE", "true").lower() == "true"
-    if mock_mode:
+    if _mock_mode():
         return _generate_mock_commentary(user_message, agent_state)
     return _generate_bedrock_commentary(user_message, agent_state)
 
@@ -495,8 +634,8 @@ async def agent_endpoint(input_data: RunAgentInput, request: Request):
     encoder = EventEncoder(accept=accept)
 
     async def event_generator():
-        run_id = input_data.run_id or str(uuid.uuid4())
-        thread_id = input_data.thread_id or str(uuid.uuid4())
+        run_id = input_data.run_id or uuid.uuid4().hex
+        thread_id = input_data.thread_id or uuid.uuid4().hex
 
         try:
             # 1. RUN_STARTED
@@ -535,62 +674,69 @@ async def agent_endpoint(input_data: RunAgentInput, request: Request):
                     refined_red_tactic = "desperate recovery"
                     refined_blue_tactic = "pressing advantage"
 
-            yield encoder.encode(StateDeltaEvent(
-                type=EventType.STATE_DELTA,
-                delta=[
-                    {"op": "replace", "path": "/strategyAnalysis/red/currentTactic", "value": refined_red_tactic},
-                    {"op": "replace", "path": "/strategyAnalysis/blue/currentTactic", "value": refined_blue_tactic},
-                ],
-            ))
-            await asyncio.sleep(0.1)
+            # Only send ops that change what the snapshot already carries
+            tactic_delta = [
+                {"op": "replace", "path": f"/strategyAnalysis/{side}/currentTactic", "value": tactic}
+                for side, tactic in (("red", refined_red_tactic), ("blue", refined_blue_tactic))
+                if tactic != agent_state["strategyAnalysis"][side]["currentTactic"]
+            ]
+            if tactic_delta:
+                yield encoder.encode(StateDeltaEvent(
+                    type=EventType.STATE_DELTA,
+                    delta=tactic_delta,
+                ))
+                await asyncio.sleep(0.1)
 
             # 5. STATE_DELTA -- update momentum with refined analysis
             momentum = agent_state["momentum"]
-            yield encoder.encode(StateDeltaEvent(
-                type=EventType.STATE_DELTA,
-                delta=[
-                    {"op": "replace", "path": "/momentum/confidence", "value": min(1.0, momentum["confidence"] + 0.05)},
-                ],
-            ))
-            await asyncio.sleep(0.05)
+            refined_confidence = min(1.0, momentum["confidence"] + 0.05)
+            if refined_confidence != momentum["confidence"]:
+                yield encoder.encode(StateDeltaEvent(
+                    type=EventType.STATE_DELTA,
+                    delta=[
+                        {"op": "replace", "path": "/momentum/confidence", "value": refined_confidence},
+                    ],
+                ))
+                await asyncio.sleep(0.05)
 
             # 6. Generate commentary text
             # Update agent state with refinements before generating commentary
             agent_state["strategyAnalysis"]["red"]["currentTactic"] = refined_red_tactic
             agent_state["strategyAnalysis"]["blue"]["currentTactic"] = refined_blue_tactic
-            commentary = _generate_commentary(user_message, agent_state)
-
-            # Update currentInsight in state
-            yield encoder.encode(StateDeltaEvent(
-                type=EventType.STATE_DELTA,
-                delta=[
-                    {"op": "replace", "path": "/currentInsight", "value": commentary[:120]},
-                ],
-            ))
-            await asyncio.sleep(0.05)
 
             # 7. TEXT_MESSAGE_START
-            message_id = str(uuid.uuid4())
+            message_id = uuid.uuid4().hex
             yield encoder.encode(TextMessageStartEvent(
                 type=EventType.TEXT_MESSAGE_START,
                 message_id=message_id,
                 role="assistant",
             ))
 
-            # 8. TEXT_MESSAGE_CONTENT -- stream in chunks
-            for chunk in _chunk_text(commentary, 12):
-                yield encoder.encode(TextMessageContentEvent(
-                    type=EventType.TEXT_MESSAGE_CONTENT,
-                    message_id=message_id,
-                    delta=chunk,
-                ))
-                await asyncio.sleep(0.03)
+            # 8. TEXT_MESSAGE_CONTENT -- forward commentary as it is generated
+            commentary_parts: list[str] = []
+            async with aclosing(_stream_commentary(user_message, agent_state)) as chunks:
+                async for chunk in chunks:
+                    commentary_parts.append(chunk)
+                    yield encoder.encode(TextMessageContentEvent(
+                        type=EventType.TEXT_MESSAGE_CONTENT,
+                        message_id=message_id,
+                        delta=chunk,
+                    ))
+            commentary = "".join(commentary_parts)
 
             # 9. TEXT_MESSAGE_END
             yield encoder.encode(TextMessageEndEvent(
                 type=EventType.TEXT_MESSAGE_END,
                 message_id=message_id,
             ))
+
+            # Update currentInsight in state
+            yield encoder.encode(StateDeltaEvent(
+                type=EventType.STATE_DELTA,
+                delta=[
+                    {"op": "replace", "path": "/currentInsight", "value": commentary[:120]},
+                ],
+            ))
             await asyncio.sleep(0.05)
 
             # 10. TOOL_CALL -- showInsightCard (if there is an insight to show)
@@ -641,7 +787,7 @@ async def agent_endpoint(input_data: RunAgentInput, request: Request):
             logger.error("AG-UI agent error: %s", e, exc_info=True)
             yield encoder.encode(RunErrorEvent(
                 type=EventType.RUN_ERROR,
-                message=str(e),
+                message=type(e).__name__,
                 code="INTERNAL_ERROR",
             ))
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import time
@@ -32,6 +33,9 @@ class NoOpStatsd:
             yield
         return _noop_ctx()
 
+    def flush(self) -> None:
+        pass
+
 
 _dd_instance: Optional[object] = None
 
@@ -52,7 +56,9 @@ def connect_datadog():
         from datadog import DogStatsd
 
         port = int(os.getenv("DD_PORT", "8125"))
-        _dd_instance = DogStatsd(host=host, port=port)
+        # Buffered: metrics emitted together (e.g. per prediction) share one UDP packet,
+        # flushed by the client's background thread.
+        _dd_instance = DogStatsd(host=host, port=port, disable_buffering=False)
         logger.info("DogStatsD connected: %s:%d", host, port)
     except Exception as e:
         logger.warning("Failed to connect DogStatsD: %s — using no-op client", e)
@@ -65,6 +71,12 @@ def connect_datadog():
 dd = connect_datadog()
 
 
+@functools.lru_cache(maxsize=None)
+def _agent_tags(agent: str) -> list[str]:
+    """Shared ["agent:<name>"] tag list; DogStatsd never mutates the tags it is given."""
+    return [f"agent:{agent}"]
+
+
 class ArenaMetrics:
     """All custom metrics for Agent Colosseum."""
 
@@ -72,7 +84,7 @@ class ArenaMetrics:
         self._dd = dd
 
     def log_prediction(self, agent: str, confidence: float, was_correct: bool) -> None:
-        tags = [f"agent:{agent}"]
+        tags = _agent_tags(agent)
         self._dd.increment("arena.predictions.total", tags=tags)
         self._dd.gauge("arena.prediction.confidence", confidence, tags=tags)
         if was_correct:
@@ -80,16 +92,33 @@ class ArenaMetrics:
         else:
             self._dd.increment("arena.predictions.wrong", tags=tags)
 
+    def log_predictions(self, agent: str, outcomes: list[tuple[float, bool]]) -> None:
+        """Record a round's (confidence, was_correct) predictions for one agent.
+
+        Counters are summed so a round costs three increments instead of two per prediction.
+        """
+        if not outcomes:
+            return
+        tags = _agent_tags(agent)
+        correct = sum(1 for _, was_correct in outcomes if was_correct)
+        self._dd.increment("arena.predictions.total", value=len(outcomes), tags=tags)
+        for confidence, _ in outcomes:
+            self._dd.gauge("arena.prediction.confidence", confidence, tags=tags)
+        if correct:
+            self._dd.increment("arena.predictions.correct", value=correct, tags=tags)
+        if correct < len(outcomes):
+            self._dd.increment("arena.predictions.wrong", value=len(outcomes) - correct, tags=tags)
+
     def log_round_latency_value(self, agent: str, latency_seconds: float) -> None:
-        tags = [f"agent:{agent}"]
+        tags = _agent_tags(agent)
         self._dd.timing("arena.round.latency", latency_seconds * 1000, tags=tags)
 
     def log_round_latency(self, agent: str):
         """Use as context manager: with metrics.log_round_latency('red'):"""
-        return self._dd.timed("arena.round.latency", tags=[f"agent:{agent}"])
+        return self._dd.timed("arena.round.latency", tags=_agent_tags(agent))
 
     def log_imagination_depth(self, agent: str, branch_count: int, max_depth: int) -> None:
-        tags = [f"agent:{agent}"]
+        tags = _agent_tags(agent)
         self._dd.gauge("arena.imagination.branches", branch_count, tags=tags)
         self._dd.gauge("arena.imagination.depth", max_depth, tags=tags)
 
@@ -110,7 +139,7 @@ class ArenaMetrics:
         self, agent: str, input_tokens: int, output_tokens: int, prediction_count: int = 1
     ) -> None:
         """Track LLM token consumption per prediction and total."""
-        tags = [f"agent:{agent}"]
+        tags = _agent_tags(agent)
         total = input_tokens + output_tokens
         per_prediction = total / max(prediction_count, 1)
         self._dd.histogram("arena.tokens.per_prediction", per_prediction, tags=tags)
@@ -125,12 +154,9 @@ class ArenaMetrics:
             tags=[f"agent:{agent}", f"strategy:{strategy}"],
         )
 
-    def log_game_type(self, game_type: str, match_id: str) -> None:
+    def log_game_type(self, game_type: str) -> None:
         """Track which game types are being played."""
-        self._dd.increment(
-            "arena.game.type",
-            tags=[f"game_type:{game_type}", f"match_id:{match_id}"],
-        )
+        self._dd.increment("arena.game.type", tags=[f"game_type:{game_type}"])
 
     def log_confidence_calibration(
         self, agent: str, predicted_confidence: float, actual_accuracy: float
@@ -140,18 +166,18 @@ class ArenaMetrics:
         self._dd.histogram(
             "arena.confidence.calibration",
             calibration_error,
-            tags=[f"agent:{agent}"],
+            tags=_agent_tags(agent),
         )
         self._dd.gauge(
-            "arena.confidence.predicted", predicted_confidence, tags=[f"agent:{agent}"]
+            "arena.confidence.predicted", predicted_confidence, tags=_agent_tags(agent)
         )
         self._dd.gauge(
-            "arena.confidence.actual", actual_accuracy, tags=[f"agent:{agent}"]
+            "arena.confidence.actual", actual_accuracy, tags=_agent_tags(agent)
         )
 
-    def log_match_duration(self, match_id: str, duration_ms: float) -> None:
+    def log_match_duration(self, duration_ms: float) -> None:
         """Track total match wall-clock duration in milliseconds."""
-        self._dd.histogram("arena.match.duration_ms", duration_ms, tags=[f"match_id:{match_id}"])
+        self._dd.histogram("arena.match.duration_ms", duration_ms)
 
     def log_personality_win(self, personality: str, opponent_personality: str, won: bool) -> None:
         """Track win/loss by personality matchup for personality_win_rate."""
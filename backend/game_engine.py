@@ -23,7 +23,7 @@ class Resource(str, Enum):
     C = "C"
 
 
-@dataclass
+@dataclass(slots=True)
 class Move:
     type: MoveType
     target: Resource
@@ -75,7 +75,7 @@ class GameState:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RoundResolution:
     round_winner: Optional[str]  # "red", "blue", or None for draw
     resource_changes: dict[str, dict[str, int]]  # {resource: {red: delta, blue: delta}}
@@ -92,18 +92,20 @@ class RoundResolution:
 BUDGET = 100
 
 
+# The move set does not depend on game state; build it once at import.
+# Amount can vary; provide a few standard allocations.
+_VALID_MOVES: tuple[dict, ...] = tuple(
+    {"type": move_type.value, "target": resource.value, "amount": amount}
+    for move_type in MoveType
+    for resource in Resource
+    for amount in (20, 40, 60, 80, 100)
+    if amount <= BUDGET
+)
+
+
 def get_valid_moves(game_state: GameState) -> list[dict]:
     """Return all valid moves for the current game state."""
-    moves = []
-    for move_type in MoveType:
-        for resource in Resource:
-            # Amount can vary; provide a few standard allocations
-            for amount in [20, 40, 60, 80, 100]:
-                if amount <= BUDGET:
-                    moves.append(
-                        {"type": move_type.value, "target": resource.value, "amount": amount}
-                    )
-    return moves
+    return [dict(m) for m in _VALID_MOVES]
 
 
 def resolve_round(
@@ -199,11 +201,9 @@ def resolve_round(
 
 def is_game_over(game_state: GameState) -> bool:
     """Check if the game is over (all rounds played or all resources depleted)."""
-    if game_state.round_number > game_state.total_rounds:
-        return True
-    if all(v <= 0 for v in game_state.resources.values()):
-        return True
-    return False
+    return game_state.round_number > game_state.total_rounds or all(
+        v <= 0 for v in game_state.resources.values()
+    )
 
 
 def get_winner(game_state: GameState) -> str:
@@ -11,9 +11,12 @@ from collections import OrderedDict
 from contextlib import asynccontextmanager
 from typing import Any
 
+import orjson
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from typing import Literal
 from pydantic import BaseModel, Field
 
@@ -86,8 +89,31 @@ async def lifespan(app: FastAPI):
     except Exception:
         pass
 
+    try:
+        from backend.datadog_metrics import dd
+
+        dd.flush()
+    except Exception:
+        pass
+
+
+# Parsed once at import; entries are trimmed so "a, b" style values still match.
+origins = tuple(
+    o.strip()
+    for o in os.getenv("CORS_ORIGINS", "http://localhost:3000,http://127.0.0.1:3000").split(",")
+    if o.strip()
+)
+
+
+class RestGZipMiddleware(GZipMiddleware):
+    """Gzip REST responses only; SSE streams must reach the client uncompressed per event."""
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith("/api/"):
+            await super().__call__(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
 
-origins = os.getenv("CORS_ORIGINS", "http://localhost:3000,http://127.0.0.1:3000").split(",")
 
 app = FastAPI(title="Agent Colosseum", version="0.1.0", lifespan=lifespan)
 
@@ -98,6 +124,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Graph, replay and leaderboard payloads are large, repetitive JSON
+app.add_middleware(RestGZipMiddleware, minimum_size=1024)
 
 # In-memory match state store (fine for hackathon / single-server)
 _matches: OrderedDict[str, dict[str, Any]] = OrderedDict()
@@ -183,31 +211,34 @@ async def list_matches():
     return {"matches": matches}
 
 
+# Static catalogue, encoded once; served verbatim on every request
+GAME_TYPES_CATALOGUE = (
+    {
+        "id": "resource_wars",
+        "name": "Resource Wars",
+        "description": "10-round strategic resource capture. Agents bid, bluff, and counter for control of 3 resource pools.",
+        "defaultRounds": 10,
+    },
+    {
+        "id": "negotiation",
+        "name": "The Negotiation",
+        "description": "5-round sequential offer negotiation. One agent sells, the other buys. Hidden walkaway prices determine scoring.",
+        "defaultRounds": 5,
+    },
+    {
+        "id": "auction",
+        "name": "The Auction",
+        "description": "8-item sealed-bid auction. Each agent starts with 1000 credits and hidden valuations. Highest bid wins.",
+        "defaultRounds": 8,
+    },
+)
+_GAME_TYPES_BODY = orjson.dumps({"gameTypes": GAME_TYPES_CATALOGUE})
+
+
 @app.get("/api/game-types")
 async def game_types():
     """Return available game types and their configurations."""
-    return {
-        "gameTypes": [
-            {
-                "id": "resource_wars",
-                "name": "Resource Wars",
-                "description": "10-round strategic resource capture. Agents bid, bluff, and counter for control of 3 resource pools.",
-                "defaultRounds": 10,
-            },
-            {
-                "id": "negotiation",
-                "name": "The Negotiation",
-                "description": "5-round sequential offer negotiation. One agent sells, the other buys. Hidden walkaway prices determine scoring.",
-                "defaultRounds": 5,
-            },
-            {
-                "id": "auction",
-                "name": "The Auction",
-                "description": "8-item sealed-bid auction. Each agent starts with 1000 credits and hidden valuations. Highest bid wins.",
-                "defaultRounds": 8,
-            },
-        ]
-    }
+    return Response(content=_GAME_TYPES_BODY, media_type="application/json")
 
 
 @app.get("/health")
@@ -238,7 +269,7 @@ async def get_match_replay(match_id: str):
     try:
         from backend.mongodb_client import get_mongodb_client
         mongo = get_mongodb_client()
-        doc = mongo.get_match_replay(match_id)
+        doc = await asyncio.to_thread(mongo.get_match_replay, match_id)
         if doc:
             return doc
     except Exception:
@@ -252,7 +283,7 @@ async def get_agent_stats(personality: str):
     try:
         from backend.mongodb_client import get_mongodb_client
         mongo = get_mongodb_client()
-        return mongo.get_agent_stats(personality)
+        return await asyncio.to_thread(mongo.get_agent_stats, personality)
     except Exception as e:
         logger.warning("Failed to get agent stats: %s", e)
         return {"personality": personality, "total_matches": 0, "wins": 0,
@@ -265,13 +296,13 @@ async def get_leaderboard():
     try:
         from backend.mongodb_client import get_mongodb_client
         mongo = get_mongodb_client()
-        return {"leaderboard": mongo.get_leaderboard()}
+        return {"leaderboard": await asyncio.to_thread(mongo.get_leaderboard)}
     except Exception as e:
         logger.warning("Failed to get leaderboard: %s", e)
         return {"leaderboard": []}
 
 
-@app.get("/api/neo4j/graph")
+@app.get("/api/neo4j/graph", response_class=ORJSONResponse)
 async def get_neo4j_graph():
     """Strategy graph nodes and BEATS edges for the 3D visualisation."""
     try:
@@ -304,13 +335,8 @@ async def get_neo4j_patterns(agent_id: str):
     try:
         from backend.neo4j_client import get_neo4j_client
         client = get_neo4j_client()
-        accuracy = await client.get_prediction_accuracy(agent_id)
-        bluff = await client.get_bluff_detection([])
-        return {
-            "agent_id": agent_id,
-            "prediction_accuracy": accuracy,
-            "bluff_patterns": bluff,
-        }
+        patterns = await client.get_agent_patterns(agent_id)
+        return {"agent_id": agent_id, **patterns}
     except Exception as e:
         logger.warning("Failed to get Neo4j patterns: %s", e)
         return {"agent_id": agent_id, "prediction_accuracy": [], "bluff_patterns": []}
@@ -347,10 +373,16 @@ async def websocket_match(websocket: WebSocket, match_id: str):
 
     try:
         # Wait for start_match message from client
-        start_msg = await asyncio.wait_for(websocket.receive_json(), timeout=30.0)
+        raw = await asyncio.wait_for(websocket.receive_text(), timeout=30.0)
+        try:
+            start_msg = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            await websocket.send_json({"type": "error", "message": "Invalid JSON"})
+            await websocket.close()
+            return
         logger.info("Received start message: %s", start_msg)
 
-        if start_msg.get("type") != "start_match":
+        if not isinstance(start_msg, dict) or start_msg.get("type") != "start_match":
             await websocket.send_json({"type": "error", "message": "Expected start_match message"})
             await websocket.close()
             return
@@ -394,7 +426,8 @@ async def websocket_match(websocket: WebSocket, match_id: str):
             # Run the match and stream events
             match = Match(config=config)
             async for event in match.run_match():
-                await websocket.send_json(event)
+                # orjson encodes straight to bytes; frames stay text for the browser client
+                await websocket.send_text(orjson.dumps(event).decode())
                 # Store event for replay
                 if match_id in _matches:
                     _matches[match_id]["events"].append(event)
@@ -428,7 +461,7 @@ async def websocket_match(websocket: WebSocket, match_id: str):
     except Exception as e:
         logger.error("Match %s error: %s", match_id, e, exc_info=True)
         try:
-            await websocket.send_json({"type": "error", "message": str(e)})
+            await websocket.send_json({"type": "error", "message": type(e).__name__})
         except Exception:
             pass
 
@@ -6,6 +6,7 @@ import asyncio
 import logging
 import time
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Any, AsyncGenerator, Optional
 
@@ -24,6 +25,27 @@ from backend import auction_engine
 
 logger = logging.getLogger(__name__)
 
+# Agents only ever look at the last few moves of each side (prompts send [-5:])
+HISTORY_WINDOW = 5
+
+# Strong references to detached persistence tasks so they aren't garbage-collected mid-write
+_background_writes: set[asyncio.Task] = set()
+
+
+async def _wait_previous_write(previous: Optional[asyncio.Task]) -> None:
+    """Wait for the previous write in a match's chain without inheriting its outcome.
+
+    A failed or cancelled earlier write is logged here, so the write queued
+    behind it still runs.
+    """
+    if previous is None:
+        return
+    await asyncio.wait([previous])
+    if previous.cancelled():
+        logger.warning("Earlier persistence write was cancelled")
+    elif previous.exception() is not None:
+        logger.warning("Earlier persistence write failed: %s", previous.exception())
+
 
 @dataclass
 class MatchConfig:
@@ -47,8 +69,8 @@ class Match:
     game_state: Any = field(default=None)  # GameState | NegotiationState | AuctionState
     red_agent: AgentPredictor = field(default=None)
     blue_agent: AgentPredictor = field(default=None)
-    red_history: list[dict] = field(default_factory=list)
-    blue_history: list[dict] = field(default_factory=list)
+    red_history: deque[dict] = field(default_factory=lambda: deque(maxlen=HISTORY_WINDOW))
+    blue_history: deque[dict] = field(default_factory=lambda: deque(maxlen=HISTORY_WINDOW))
     total_futures_simulated: int = 0
     red_correct: int = 0
     blue_correct: int = 0
@@ -57,6 +79,7 @@ class Match:
     _neo4j_client: Any = None
     _mongodb_client: Any = None
     _metrics: Any = None
+    _persist_task: Optional[asyncio.Task] = None
 
     def __post_init__(self):
         gt = self.config.game_type
@@ -117,24 +140,21 @@ class Match:
                 "totalRounds": self.config.total_rounds,
             }
 
-            # Initialize match document in MongoDB
+            # Initialize match document in MongoDB (in the background; round writes chain after it)
             if self._mongodb_client:
-                try:
-                    from datetime import datetime, timezone
-                    self._mongodb_client.store_match({
-                        "match_id": self.config.match_id,
-                        "game_type": self.config.game_type,
-                        "agents": {
-                            "red": {"personality": self.config.red_personality, "model": "mock"},
-                            "blue": {"personality": self.config.blue_personality, "model": "mock"},
-                        },
-                        "total_rounds": self.config.total_rounds,
-                        "started_at": datetime.now(timezone.utc).isoformat(),
-                        "state": "running",
-                        "rounds": [],
-                    })
-                except Exception as e:
-                    logger.warning("MongoDB match init failed: %s", e)
+                from datetime import datetime, timezone
+                self._persist_task = asyncio.create_task(self._store_match_doc(self._persist_task, {
+                    "match_id": self.config.match_id,
+                    "game_type": self.config.game_type,
+                    "agents": {
+                        "red": {"personality": self.config.red_personality, "model": "mock"},
+                        "blue": {"personality": self.config.blue_personality, "model": "mock"},
+                    },
+                    "total_rounds": self.config.total_rounds,
+                    "started_at": datetime.now(timezone.utc).isoformat(),
+                    "state": "running",
+                    "rounds": [],
+                }))
 
             yield match_start_event
 
@@ -148,25 +168,9 @@ class Match:
             # --- match_end ---
             winner = self._get_winner()
 
-            # --- Record strategy relationship in Neo4j ---
-            if self._neo4j_client and winner in ("red", "blue"):
-                loser = "blue" if winner == "red" else "red"
-                winner_personality = (
-                    self.config.red_personality if winner == "red"
-                    else self.config.blue_personality
-                )
-                loser_personality = (
-                    self.config.blue_personality if winner == "red"
-                    else self.config.red_personality
-                )
-                try:
-                    await self._neo4j_client.store_strategy_relationship(
-                        winner_strategy=winner_personality,
-                        loser_strategy=loser_personality,
-                        match_id=self.config.match_id,
-                    )
-                except Exception as e:
-                    logger.warning("Neo4j strategy relationship storage failed: %s", e)
+            # Round writes must land before the match is finalized. asyncio.wait
+            # (via the helper) keeps a cancelled match from cancelling the chain.
+            await _wait_previous_write(self._persist_task)
 
             red_accuracy = (
                 self.red_correct / self.red_total_predictions
@@ -197,12 +201,33 @@ class Match:
                     abs(self.game_state.scores["red"] - self.game_state.scores["blue"]),
                 )
 
-            # Finalize match in MongoDB
+            # --- Record strategy relationship in Neo4j and finalize in MongoDB (concurrently) ---
+            writes, labels = [], []
+            if self._neo4j_client and winner in ("red", "blue"):
+                winner_personality = (
+                    self.config.red_personality if winner == "red"
+                    else self.config.blue_personality
+                )
+                loser_personality = (
+                    self.config.blue_personality if winner == "red"
+                    else self.config.red_personality
+                )
+                writes.append(self._neo4j_client.store_strategy_relationship(
+                    winner_strategy=winner_personality,
+                    loser_strategy=loser_personality,
+                    match_id=self.config.match_id,
+                ))
+                labels.append("Neo4j strategy relationship storage")
             if self._mongodb_client:
-                try:
-                    self._mongodb_client.finalize_match(self.config.match_id, match_end_event)
-                except Exception as e:
-                    logger.warning("MongoDB match finalize failed: %s", e)
+                writes.append(asyncio.to_thread(
+                    self._mongodb_client.finalize_match, self.config.match_id, match_end_event
+                ))
+                labels.append("MongoDB match finalize")
+
+            results = await asyncio.gather(*writes, return_exceptions=True)
+            for label, result in zip(labels, results):
+                if isinstance(result, Exception):
+                    logger.warning("%s failed: %s", label, result)
 
             _match_completed = True
             yield match_end_event
@@ -210,14 +235,17 @@ class Match:
         finally:
             # If match didn't complete normally (error, cancellation, client disconnect),
             # mark it as abandoned in MongoDB so it doesn't stay stuck as "running".
+            # Fire-and-forget: the generator may be closing, so don't block on the write.
             if not _match_completed and self._mongodb_client:
                 try:
                     from datetime import datetime, timezone
-                    self._mongodb_client.store_match({
+                    task = asyncio.get_running_loop().create_task(self._store_match_doc(self._persist_task, {
                         "match_id": self.config.match_id,
                         "state": "abandoned",
                         "ended_at": datetime.now(timezone.utc).isoformat(),
-                    })
+                    }))
+                    _background_writes.add(task)
+                    task.add_done_callback(_background_writes.discard)
                 except Exception:
                     pass
 
@@ -265,9 +293,9 @@ class Match:
             "gameState": self.game_state.to_dict(),
         }
         if self.config.game_type == "negotiation":
-            round_start_event["negotiationState"] = self.game_state.to_dict()
+            round_start_event["negotiationState"] = round_start_event["gameState"]
         elif self.config.game_type == "auction":
-            round_start_event["auctionState"] = self.game_state.to_dict()
+            round_start_event["auctionState"] = round_start_event["gameState"]
         yield round_start_event
 
         # --- thinking phase (parallel) ---
@@ -323,27 +351,25 @@ class Match:
         state_before = self.game_state.copy()
         resolution = self._resolve_round(red_move, blue_move)
 
+        # Serialized once, shared by the events, the move history and persistence
+        red_move_dict = red_move.to_dict()
+        blue_move_dict = blue_move.to_dict()
+        resolution_dict = resolution.to_dict()
+
         # --- Check prediction accuracy ---
+        # Label each actual move once; shared by annotation and LLMObs evals.
+        gt = self.config.game_type
+        actual_red_move_str = self._move_label(red_move)
+        actual_blue_move_str = self._move_label(blue_move)
         red_preds_annotated = self._annotate_predictions(
-            red_result.predictions, blue_move, "red"
+            red_result.predictions, blue_move, actual_blue_move_str, "red"
         )
         blue_preds_annotated = self._annotate_predictions(
-            blue_result.predictions, red_move, "blue"
+            blue_result.predictions, red_move, actual_red_move_str, "blue"
         )
 
         # --- LLMObs deferred evaluations: submit now that actual moves are known ---
         # Red predicted blue's move; blue predicted red's move.
-        gt = self.config.game_type
-        if gt == "negotiation":
-            actual_blue_move_str = f"{blue_move.type.value}_{blue_move.price}"
-            actual_red_move_str = f"{red_move.type.value}_{red_move.price}"
-        elif gt == "auction":
-            actual_blue_move_str = f"{blue_move.type.value}_{blue_move.amount}"
-            actual_red_move_str = f"{red_move.type.value}_{red_move.amount}"
-        else:
-            actual_blue_move_str = f"{blue_move.type.value}_{blue_move.target.value}"
-            actual_red_move_str = f"{red_move.type.value}_{red_move.target.value}"
-
         # red predicted blue's move → score against actual_blue_move_str
         _llmobs_submit_evaluation(
             "red", red_result.predictions, actual_blue_move_str, red_result.llmobs_span
@@ -358,12 +384,12 @@ class Match:
             "type": "collapse",
             "redPredictions": red_preds_annotated,
             "bluePredictions": blue_preds_annotated,
-            "resolution": resolution.to_dict(),
+            "resolution": resolution_dict,
         }
 
         # Store move history
-        self.red_history.append(red_move.to_dict())
-        self.blue_history.append(blue_move.to_dict())
+        self.red_history.append(red_move_dict)
+        self.blue_history.append(blue_move_dict)
 
         # Calculate accuracy for this round
         red_round_correct = sum(1 for p in red_preds_annotated if p.get("wasCorrect"))
@@ -387,9 +413,9 @@ class Match:
             "gameState": self.game_state.to_dict(),
         }
         if self.config.game_type == "negotiation":
-            round_end_event["negotiationState"] = self.game_state.to_dict()
+            round_end_event["negotiationState"] = round_end_event["gameState"]
         elif self.config.game_type == "auction":
-            round_end_event["auctionState"] = self.game_state.to_dict()
+            round_end_event["auctionState"] = round_end_event["gameState"]
         yield round_end_event
 
         # --- Metrics ---
@@ -398,72 +424,82 @@ class Match:
             self._metrics.log_round_latency_value("red", round_latency)
             self._metrics.log_round_latency_value("blue", round_latency)
 
-        # --- Neo4j storage ---
-        if self._neo4j_client:
-            try:
-                if gt == "negotiation":
-                    await self._neo4j_client.store_negotiation_round(
-                        match_id=self.config.match_id,
-                        round_data={
-                            "round": round_num,
-                            "state_hash": state_before.state_hash(),
-                            "red_move": red_move.to_dict(),
-                            "blue_move": blue_move.to_dict(),
-                            "red_predictions": red_preds_annotated,
-                            "blue_predictions": blue_preds_annotated,
-                        },
-                    )
-                elif gt == "auction":
-                    current_item = state_before.current_item()
-                    await self._neo4j_client.store_auction_round(
-                        match_id=self.config.match_id,
-                        round_data={
-                            "round": round_num,
-                            "state_hash": state_before.state_hash(),
-                            "item_name": current_item.name if current_item else "",
-                            "red_move": red_move.to_dict(),
-                            "blue_move": blue_move.to_dict(),
-                            "red_predictions": red_preds_annotated,
-                            "blue_predictions": blue_preds_annotated,
-                        },
-                    )
-                else:
-                    await self._neo4j_client.store_round(
-                        match_id=self.config.match_id,
-                        round_data={
-                            "round": round_num,
-                            "state_hash": state_before.state_hash(),
-                            "red_move": red_move.to_dict(),
-                            "blue_move": blue_move.to_dict(),
-                            "red_predictions": red_preds_annotated,
-                            "blue_predictions": blue_preds_annotated,
-                            "resolution": resolution.to_dict(),
-                        },
-                    )
-            except Exception as e:
-                logger.warning("Neo4j storage failed: %s", e)
-
-        # --- MongoDB round storage ---
+        # --- Persistence (off the event stream, ordered per match) ---
+        if gt == "negotiation":
+            neo4j_store = self._neo4j_client.store_negotiation_round if self._neo4j_client else None
+            neo4j_round_data = {}
+        elif gt == "auction":
+            neo4j_store = self._neo4j_client.store_auction_round if self._neo4j_client else None
+            current_item = state_before.current_item()
+            neo4j_round_data = {"item_name": current_item.name if current_item else ""}
+        else:
+            neo4j_store = self._neo4j_client.store_round if self._neo4j_client else None
+            neo4j_round_data = {"resolution": resolution_dict}
+        neo4j_round_data.update({
+            "round": round_num,
+            "state_hash": state_before.state_hash(),
+            "red_move": red_move_dict,
+            "blue_move": blue_move_dict,
+            "red_predictions": red_preds_annotated,
+            "blue_predictions": blue_preds_annotated,
+        })
+        mongo_round_data = {
+            "round": round_num,
+            "game_state": state_before.to_dict(),
+            "red": {
+                "predictions": red_preds_annotated,
+                "chosen_move": red_move_dict,
+            },
+            "blue": {
+                "predictions": blue_preds_annotated,
+                "chosen_move": blue_move_dict,
+            },
+            "resolution": resolution_dict,
+        }
+        if neo4j_store or self._mongodb_client:
+            self._persist_task = asyncio.create_task(
+                self._persist_round(self._persist_task, neo4j_store, neo4j_round_data, mongo_round_data)
+            )
+
+    async def _store_match_doc(self, previous: Optional[asyncio.Task], match_doc: dict) -> None:
+        """Upsert the MongoDB match document once earlier writes for this match are done."""
+        try:
+            await _wait_previous_write(previous)
+        except BaseException:
+            # Cancelled while waiting (e.g. the match task was torn down): still record
+            # the final state, otherwise the match stays "running" forever.
+            pass
+        try:
+            await asyncio.to_thread(self._mongodb_client.store_match, match_doc)
+        except Exception as e:
+            logger.warning("MongoDB match document write failed: %s", e)
+
+    async def _persist_round(
+        self,
+        previous: Optional[asyncio.Task],
+        neo4j_store,
+        neo4j_round_data: dict,
+        mongo_round_data: dict,
+    ) -> None:
+        """Write a round to Neo4j and MongoDB once the previous round's writes are done."""
+        await _wait_previous_write(previous)
+
+        writes, labels = [], []
+        if neo4j_store:
+            writes.append(neo4j_store(match_id=self.config.match_id, round_data=neo4j_round_data))
+            labels.append("Neo4j")
         if self._mongodb_client:
-            try:
-                self._mongodb_client.store_round(
-                    match_id=self.config.match_id,
-                    round_data={
-                        "round": round_num,
-                        "game_state": state_before.to_dict(),
-                        "red": {
-                            "predictions": red_preds_annotated,
-                            "chosen_move": red_move.to_dict(),
-                        },
-                        "blue": {
-                            "predictions": blue_preds_annotated,
-                            "chosen_move": blue_move.to_dict(),
-                        },
-                        "resolution": resolution.to_dict(),
-                    },
-                )
-            except Exception as e:
-                logger.warning("MongoDB round storage failed: %s", e)
+            writes.append(asyncio.to_thread(
+                self._mongodb_client.store_round,
+                match_id=self.config.match_id,
+                round_data=mongo_round_data,
+            ))
+            labels.append("MongoDB")
+
+        results = await asyncio.gather(*writes, return_exceptions=True)
+        for label, result in zip(labels, results):
+            if isinstance(result, Exception):
+                logger.warning("%s round storage failed: %s", label, result)
 
     async def _get_prediction(self, agent: str) -> PredictionResult:
         """Get prediction from an agent with error handling."""
@@ -471,13 +507,13 @@ class Match:
             if agent == "red":
                 opponent_personality = self.config.blue_personality
                 return await self.red_agent.predict_opponent(
-                    self.game_state, self.blue_history, self.red_history,
+                    self.game_state, list(self.blue_history), list(self.red_history),
                     opponent_personality=opponent_personality,
                 )
             else:
                 opponent_personality = self.config.red_personality
                 return await self.blue_agent.predict_opponent(
-                    self.game_state, self.red_history, self.blue_history,
+                    self.game_state, list(self.red_history), list(self.blue_history),
                     opponent_personality=opponent_personality,
                 )
         except Exception as e:
@@ -485,25 +521,28 @@ class Match:
             return PredictionResult(
                 predictions=[],
                 chosen_move=self._default_move(),
-                reasoning=f"Fallback: prediction error ({e})",
+                reasoning=f"Fallback: prediction error ({type(e).__name__})",
             )
 
+    def _move_label(self, move) -> str:
+        """Return the ``type_detail`` string predictions are scored against."""
+        gt = self.config.game_type
+        if gt == "negotiation":
+            return f"{move.type.value}_{move.price}"
+        if gt == "auction":
+            return f"{move.type.value}_{move.amount}"
+        return f"{move.type.value}_{move.target.value}"
+
     def _annotate_predictions(
         self,
         predictions: list[dict],
         actual_opponent_move,
+        actual_str: str,
         agent: str,
     ) -> list[dict]:
         """Annotate each prediction with wasCorrect based on the actual opponent move."""
-        # Build actual_str depending on game type
-        gt = self.config.game_type
-        if gt == "negotiation":
-            actual_str = f"{actual_opponent_move.type.value}_{actual_opponent_move.price}"
-        elif gt == "auction":
-            actual_str = f"{actual_opponent_move.type.value}_{actual_opponent_move.amount}"
-        else:
-            actual_str = f"{actual_opponent_move.type.value}_{actual_opponent_move.target.value}"
         annotated = []
+        outcomes: list[tuple[float, bool]] = []
         for pred in predictions:
             pred_copy = dict(pred)
             predicted_move = pred_copy.get("opponentMove", "")
@@ -528,10 +567,10 @@ class Match:
             else:
                 self.blue_total_predictions += 1
 
-            # Log to metrics
-            if self._metrics:
-                confidence = pred_copy.get("confidence", 0.5)
-                self._metrics.log_prediction(agent, confidence, was_correct)
-
+            outcomes.append((pred_copy.get("confidence", 0.5), was_correct))
             annotated.append(pred_copy)
+
+        # Log to metrics, one batch per agent per round
+        if self._metrics:
+            self._metrics.log_predictions(agent, outcomes)
         return annotated
@@ -18,7 +18,12 @@ class MongoDBClient:
     def __init__(self, uri: str):
         from pymongo import MongoClient
 
-        self._client = MongoClient(uri)
+        self._client = MongoClient(
+            uri,
+            maxPoolSize=int(os.getenv("MONGODB_MAX_POOL_SIZE", "50")),
+            maxIdleTimeMS=60_000,
+            serverSelectionTimeoutMS=int(os.getenv("MONGODB_SERVER_SELECTION_TIMEOUT_MS", "5000")),
+        )
         self._db = self._client["agent_colosseum"]
         self._matches = self._db["matches"]
         self._initialized = False
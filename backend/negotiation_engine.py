@@ -18,7 +18,7 @@ class NegotiationMoveType(str, Enum):
     BLUFF_WALKAWAY = "bluff_walkaway"
 
 
-@dataclass
+@dataclass(slots=True)
 class NegotiationMove:
     type: NegotiationMoveType
     price: int = 0  # proposed/counter price (0-100)
@@ -110,7 +110,7 @@ class NegotiationState:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class NegotiationRoundResolution:
     round_winner: Optional[str]
     description: str = ""
@@ -127,16 +127,22 @@ class NegotiationRoundResolution:
         }
 
 
+# The move set does not depend on negotiation state; build it once at import.
+_VALID_MOVES: tuple[dict, ...] = (
+    *(
+        {"type": move_type, "price": price, "terms": ""}
+        for price in range(10, 100, 10)
+        for move_type in ("propose", "counter_offer")
+    ),
+    {"type": "accept", "price": 0, "terms": ""},
+    {"type": "reject", "price": 0, "terms": ""},
+    {"type": "bluff_walkaway", "price": 0, "terms": ""},
+)
+
+
 def get_valid_moves(game_state: NegotiationState) -> list[dict]:
     """Return all valid moves for the current negotiation state."""
-    moves = []
-    for price in range(10, 100, 10):
-        moves.append({"type": "propose", "price": price, "terms": ""})
-        moves.append({"type": "counter_offer", "price": price, "terms": ""})
-    moves.append({"type": "accept", "price": 0, "terms": ""})
-    moves.append({"type": "reject", "price": 0, "terms": ""})
-    moves.append({"type": "bluff_walkaway", "price": 0, "terms": ""})
-    return moves
+    return [dict(m) for m in _VALID_MOVES]
 
 
 def resolve_round(
@@ -261,11 +267,7 @@ def resolve_round(
 
 def is_game_over(game_state: NegotiationState) -> bool:
     """Game over if all rounds played or deal was struck."""
-    if game_state.deal_price is not None:
-        return True
-    if game_state.round_number > game_state.total_rounds:
-        return True
-    return False
+    return game_state.deal_price is not None or game_state.round_number > game_state.total_rounds
 
 
 def get_winner(game_state: NegotiationState) -> str:
@@ -4,21 +4,117 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 logger = logging.getLogger(__name__)
 
 _client_instance: Optional["Neo4jClient"] = None
 
 
+def _page_clause(limit: Optional[int]) -> str:
+    """SKIP/LIMIT suffix for paged history reads; empty (full result) when no limit is given."""
+    return "SKIP $offset\nLIMIT $limit\n" if limit is not None else ""
+
+
+# One query text for every game type, so Neo4j compiles and caches a single plan.
+_STORE_ROUND_QUERY = """
+MERGE (m:Match {id: $match_id})
+SET m += $match_props
+MERGE (r:Round {id: $round_id})
+SET r += $round_props
+MERGE (m)-[:HAS_ROUND]->(r)
+
+WITH r
+UNWIND $moves AS mv
+MERGE (move:Move {id: mv.id})
+SET move += mv.props
+FOREACH (_ IN CASE WHEN mv.side = 'red' THEN [1] ELSE [] END |
+    MERGE (r)-[:RED_MOVED]->(move))
+FOREACH (_ IN CASE WHEN mv.side = 'blue' THEN [1] ELSE [] END |
+    MERGE (r)-[:BLUE_MOVED]->(move))
+
+WITH DISTINCT r
+UNWIND $predictions AS pred
+MERGE (p:Prediction {id: pred.id})
+SET p.opponent_move = pred.opponentMove,
+    p.confidence = pred.confidence,
+    p.was_correct = pred.wasCorrect,
+    p.agent = pred.agent
+MERGE (p)-[:FOR_ROUND]->(r)
+"""
+
+# Shared query bodies: each is used on its own and as a CALL subquery inside
+# get_agent_patterns, so the two forms cannot drift apart.
+_PREDICTION_ACCURACY_ROWS = """
+MATCH (p:Prediction {agent: $agent_id})-[:FOR_ROUND]->(:Round)
+WITH p.opponent_move AS predicted_move,
+     count(*) AS total_predictions,
+     sum(CASE WHEN p.was_correct THEN 1 ELSE 0 END) AS correct
+WITH predicted_move, total_predictions, correct,
+     toFloat(correct) / total_predictions AS accuracy
+ORDER BY accuracy DESC
+"""
+
+_OPPONENT_SEQUENCE_ROWS = """
+MATCH (m:Match)-[:HAS_ROUND]->(r:Round)-[:BLUE_MOVED]->(mv:Move)
+WITH m, r, mv ORDER BY r.number
+WITH m, collect(r.number) AS nums, collect(mv.type) AS seq
+UNWIND range(0, size(seq) - 3) AS i
+WITH seq, nums, i
+WHERE nums[i + 1] = nums[i] + 1 AND nums[i + 2] = nums[i] + 2
+WITH seq[i] + ' -> ' + seq[i + 1] + ' -> ' + seq[i + 2] AS pattern,
+     count(*) AS occurrences
+ORDER BY occurrences DESC
+LIMIT 5
+"""
+
+_PREDICTION_ACCURACY_QUERY = (
+    _PREDICTION_ACCURACY_ROWS
+    + "RETURN predicted_move, total_predictions, correct, accuracy\n"
+)
+
+_OPPONENT_SEQUENCE_QUERY = _OPPONENT_SEQUENCE_ROWS + "RETURN pattern, occurrences\n"
+
+_AGENT_PATTERNS_QUERY = (
+    "CALL {"
+    + _PREDICTION_ACCURACY_ROWS
+    + """RETURN collect({
+    predicted_move: predicted_move,
+    total_predictions: total_predictions,
+    correct: correct,
+    accuracy: accuracy
+}) AS prediction_accuracy
+}
+CALL {"""
+    + _OPPONENT_SEQUENCE_ROWS
+    + """RETURN collect({pattern: pattern, occurrences: occurrences}) AS bluff_patterns
+}
+RETURN prediction_accuracy, bluff_patterns
+"""
+)
+
+
+async def _write_tx(tx, query: str, **params: Any) -> None:
+    """Managed-transaction body for a single write statement."""
+    result = await tx.run(query, **params)
+    await result.consume()
+
+
 class Neo4jClient:
     """Neo4j AuraDB client with connection pooling and graceful fallback."""
 
     def __init__(self, uri: str, user: str, password: str):
         from neo4j import AsyncGraphDatabase
 
-        self._driver = AsyncGraphDatabase.driver(uri, auth=(user, password))
+        self._driver = AsyncGraphDatabase.driver(
+            uri,
+            auth=(user, password),
+            max_connection_pool_size=int(os.getenv("NEO4J_MAX_POOL_SIZE", "50")),
+            connection_acquisition_timeout=float(os.getenv("NEO4J_ACQUISITION_TIMEOUT", "30")),
+            keep_alive=True,
+        )
         self._initialized = False
+        self._schema_ready = False
         logger.info("Neo4j client initialized: %s", uri)
 
     async def close(self):
@@ -37,59 +133,59 @@ class Neo4jClient:
     async def store_round(self, match_id: str, round_data: dict) -> None:
         """Store moves, predictions, outcomes as graph nodes and relationships."""
         try:
-            async with self._driver.session() as session:
-                await session.run(
-                    """
-                    MERGE (m:Match {id: $match_id})
-                    MERGE (r:Round {id: $round_id})
-                    SET r.number = $round, r.game_state_hash = $state_hash
-                    MERGE (m)-[:HAS_ROUND]->(r)
-
-                    MERGE (redMove:Move {id: $red_move_id})
-                    SET redMove.type = $red_move_type,
-                        redMove.target = $red_target,
-                        redMove.amount = $red_amount
-                    MERGE (r)-[:RED_MOVED]->(redMove)
-
-                    MERGE (blueMove:Move {id: $blue_move_id})
-                    SET blueMove.type = $blue_move_type,
-                        blueMove.target = $blue_target,
-                        blueMove.amount = $blue_amount
-                    MERGE (r)-[:BLUE_MOVED]->(blueMove)
-
-                    WITH r
-                    UNWIND $predictions AS pred
-                    MERGE (p:Prediction {id: pred.id})
-                    SET p.opponent_move = pred.opponentMove,
-                        p.confidence = pred.confidence,
-                        p.was_correct = pred.wasCorrect,
-                        p.agent = pred.agent
-                    MERGE (p)-[:FOR_ROUND]->(r)
-                    """,
-                    match_id=match_id,
-                    round=round_data["round"],
-                    round_id=f"{match_id}_round_{round_data['round']}",
-                    red_move_id=f"{match_id}_round_{round_data['round']}_red",
-                    blue_move_id=f"{match_id}_round_{round_data['round']}_blue",
-                    state_hash=round_data.get("state_hash", ""),
-                    red_move_type=round_data["red_move"]["type"],
-                    red_target=round_data["red_move"].get("target", ""),
-                    red_amount=round_data["red_move"].get("amount", 0),
-                    blue_move_type=round_data["blue_move"]["type"],
-                    blue_target=round_data["blue_move"].get("target", ""),
-                    blue_amount=round_data["blue_move"].get("amount", 0),
-                    predictions=[
-                        {**p, "agent": "red", "id": f"{match_id}_round_{round_data['round']}_red_pred_{i}"}
-                        for i, p in enumerate(round_data.get("red_predictions", []))
-                    ]
-                    + [
-                        {**p, "agent": "blue", "id": f"{match_id}_round_{round_data['round']}_blue_pred_{i}"}
-                        for i, p in enumerate(round_data.get("blue_predictions", []))
-                    ],
-                )
+            await self._store_round_graph(
+                match_id,
+                round_data,
+                match_props={},
+                round_props={},
+                move_props=lambda move: {
+                    "type": move["type"],
+                    "target": move.get("target", ""),
+                    "amount": move.get("amount", 0),
+                },
+            )
         except Exception as e:
             logger.warning("Failed to store round in Neo4j: %s", e)
 
+    async def _store_round_graph(
+        self,
+        match_id: str,
+        round_data: dict,
+        match_props: dict,
+        round_props: dict,
+        move_props: Callable[[dict], dict],
+    ) -> None:
+        """Write a round for any game type with the shared _STORE_ROUND_QUERY."""
+        round_id = f"{match_id}_round_{round_data['round']}"
+        async with self._driver.session() as session:
+            await session.execute_write(
+                _write_tx,
+                _STORE_ROUND_QUERY,
+                match_id=match_id,
+                match_props=match_props,
+                round_id=round_id,
+                round_props={
+                    "number": round_data["round"],
+                    "game_state_hash": round_data.get("state_hash", ""),
+                    **round_props,
+                },
+                moves=[
+                    {"id": f"{round_id}_{side}", "side": side, "props": move_props(move)}
+                    for side, move in (("red", round_data["red_move"]), ("blue", round_data["blue_move"]))
+                ],
+                predictions=[
+                    {
+                        "id": f"{round_id}_{side}_pred_{i}",
+                        "agent": side,
+                        "opponentMove": p.get("opponentMove"),
+                        "confidence": p.get("confidence"),
+                        "wasCorrect": p.get("wasCorrect"),
+                    }
+                    for side in ("red", "blue")
+                    for i, p in enumerate(round_data.get(f"{side}_predictions", []))
+                ],
+            )
+
     async def get_counter_strategy(self, opponent_pattern: str) -> list[dict]:
         """Find the best counter-moves when opponent uses a given move type."""
         try:
@@ -117,11 +213,14 @@ class Neo4jClient:
             logger.warning("Neo4j counter strategy query failed: %s", e)
             return []
 
-    async def get_counter_strategies(self, agent_name: str, opponent_personality: str) -> list[str]:
+    async def get_counter_strategies(
+        self, agent_name: str, opponent_personality: str
+    ) -> Optional[list[str]]:
         """Return human-readable counter-strategy patterns for a given opponent personality.
 
         Queries stored Strategy BEATS relationships and Move data to find
-        what works against the given opponent personality.
+        what works against the given opponent personality. Returns None if
+        the lookup failed, so callers can tell an outage from an empty graph.
         """
         patterns: list[str] = []
         try:
@@ -129,8 +228,7 @@ class Neo4jClient:
                 # Query 1: Strategy BEATS relationships
                 result = await session.run(
                     """
-                    MATCH (winner:Strategy)-[b:BEATS]->(loser:Strategy)
-                    WHERE loser.name CONTAINS $opp_personality
+                    MATCH (winner:Strategy)-[b:BEATS]->(loser:Strategy {name: $opp_personality})
                     RETURN winner.name AS winner_strategy,
                            loser.name AS loser_strategy,
                            winner.wins AS total_wins,
@@ -171,6 +269,7 @@ class Neo4jClient:
                     )
         except Exception as e:
             logger.warning("Neo4j counter strategies query failed: %s", e)
+            return None
 
         return patterns
 
@@ -178,22 +277,7 @@ class Neo4jClient:
         """Detect the most common 3-move sequences in opponent play."""
         try:
             async with self._driver.session() as session:
-                result = await session.run(
-                    """
-                    MATCH (m:Match)-[:HAS_ROUND]->(r1:Round)
-                    MATCH (m)-[:HAS_ROUND]->(r2:Round)
-                    MATCH (m)-[:HAS_ROUND]->(r3:Round)
-                    MATCH (r1)-[:BLUE_MOVED]->(m1:Move)
-                    MATCH (r2)-[:BLUE_MOVED]->(m2:Move)
-                    MATCH (r3)-[:BLUE_MOVED]->(m3:Move)
-                    WHERE r2.number = r1.number + 1
-                      AND r3.number = r2.number + 1
-                    RETURN m1.type + ' -> ' + m2.type + ' -> ' + m3.type AS pattern,
-                           count(*) AS occurrences
-                    ORDER BY occurrences DESC
-                    LIMIT 5
-                    """
-                )
+                result = await session.run(_OPPONENT_SEQUENCE_QUERY)
                 records = await result.data()
                 return records
         except Exception as e:
@@ -205,18 +289,7 @@ class Neo4jClient:
         try:
             async with self._driver.session() as session:
                 result = await session.run(
-                    """
-                    MATCH (p:Prediction {agent: $agent_id})-[:FOR_ROUND]->(r:Round)
-                    WITH p.opponent_move AS predicted_move,
-                         count(*) AS total_predictions,
-                         sum(CASE WHEN p.was_correct THEN 1 ELSE 0 END) AS correct
-                    RETURN predicted_move,
-                           total_predictions,
-                           correct,
-                           toFloat(correct) / total_predictions AS accuracy
-                    ORDER BY accuracy DESC
-                    """,
-                    agent_id=agent_id,
+                    _PREDICTION_ACCURACY_QUERY, agent_id=agent_id
                 )
                 records = await result.data()
                 return records
@@ -224,6 +297,24 @@ class Neo4jClient:
             logger.warning("Neo4j prediction accuracy query failed: %s", e)
             return []
 
+    async def get_agent_patterns(self, agent_id: str) -> dict:
+        """Fetch prediction accuracy and opponent move sequences in one round-trip."""
+        try:
+            async with self._driver.session() as session:
+                result = await session.run(
+                    _AGENT_PATTERNS_QUERY, agent_id=agent_id
+                )
+                record = await result.single()
+                if record is None:
+                    return {"prediction_accuracy": [], "bluff_patterns": []}
+                return {
+                    "prediction_accuracy": record["prediction_accuracy"],
+                    "bluff_patterns": record["bluff_patterns"],
+                }
+        except Exception as e:
+            logger.warning("Neo4j agent patterns query failed: %s", e)
+            return {"prediction_accuracy": [], "bluff_patterns": []}
+
     # ------------------------------------------------------------------
     # Strategy relationships (BEATS / LOSES_TO)
     # ------------------------------------------------------------------
@@ -231,17 +322,24 @@ class Neo4jClient:
     async def store_strategy_relationship(
         self, winner_strategy: str, loser_strategy: str, match_id: str = ""
     ) -> None:
-        """Record that winner_strategy beat loser_strategy, creating Strategy nodes and edges."""
+        """Record that winner_strategy beat loser_strategy, creating Strategy nodes and edges.
+
+        Edges are keyed by match_id, so replaying the same match result does not
+        add duplicate edges or inflate the win/loss counters.
+        """
         try:
             async with self._driver.session() as session:
-                await session.run(
+                await session.execute_write(
+                    _write_tx,
                     """
                     MERGE (w:Strategy {name: $winner})
                     MERGE (l:Strategy {name: $loser})
-                    CREATE (w)-[:BEATS {match_id: $match_id, ts: timestamp()}]->(l)
-                    CREATE (l)-[:LOSES_TO {match_id: $match_id, ts: timestamp()}]->(w)
-                    SET w.wins = coalesce(w.wins, 0) + 1,
-                        l.losses = coalesce(l.losses, 0) + 1
+                    MERGE (w)-[b:BEATS {match_id: $match_id}]->(l)
+                    ON CREATE SET b.ts = timestamp(),
+                                  w.wins = coalesce(w.wins, 0) + 1,
+                                  l.losses = coalesce(l.losses, 0) + 1
+                    MERGE (l)-[lt:LOSES_TO {match_id: $match_id}]->(w)
+                    ON CREATE SET lt.ts = timestamp()
                     """,
                     winner=winner_strategy,
                     loser=loser_strategy,
@@ -250,8 +348,14 @@ class Neo4jClient:
         except Exception as e:
             logger.warning("Failed to store strategy relationship: %s", e)
 
-    async def get_strategy_evolution(self, agent_id: str) -> list[dict]:
-        """Return the sequence of strategies used by an agent over time."""
+    async def get_strategy_evolution(
+        self, agent_id: str, limit: Optional[int] = None, offset: int = 0
+    ) -> list[dict]:
+        """Return the sequence of strategies used by an agent over time.
+
+        Returns every row unless ``limit`` is given; pages follow
+        (match id, round number) order, which is stable but not chronological.
+        """
         try:
             async with self._driver.session() as session:
                 result = await session.run(
@@ -267,8 +371,10 @@ class Neo4jClient:
                            p.was_correct AS prediction_correct,
                            p.confidence AS confidence
                     ORDER BY m.id, r.number
-                    """,
+                    """ + _page_clause(limit),
                     agent_id=agent_id,
+                    offset=offset,
+                    limit=limit,
                 )
                 records = await result.data()
                 return records
@@ -304,77 +410,50 @@ class Neo4jClient:
         """
         try:
             async with self._driver.session() as session:
-                # Nodes with win-rate calculation
-                node_result = await session.run(
-                    """
-                    MATCH (s:Strategy)
-                    WITH s,
-                         coalesce(s.wins,   0) AS w,
-                         coalesce(s.losses, 0) AS l
-                    RETURN s.name AS id,
-                           s.name AS name,
-                           w AS wins,
-                           l AS losses,
-                           CASE WHEN w + l > 0
-                                THEN toFloat(w) / (w + l)
-                                ELSE 0.5 END AS win_rate,
-                           w + l AS total_matches
-                    """
-                )
-                node_records = await node_result.data()
-
-                # BEATS edges aggregated by (winner, loser) pair
-                beats_result = await session.run(
-                    """
-                    MATCH (w:Strategy)-[b:BEATS]->(l:Strategy)
-                    RETURN w.name AS source,
-                           l.name AS target,
-                           count(b) AS wins
-                    """
-                )
-                beats_records = await beats_result.data()
-
-                # LOSES_TO edges (reverse of BEATS, lighter appearance in graph)
-                loses_result = await session.run(
+                # Nodes and BEATS edges in one round-trip
+                result = await session.run(
                     """
-                    MATCH (l:Strategy)-[r:LOSES_TO]->(w:Strategy)
-                    RETURN l.name AS source,
-                           w.name AS target,
-                           count(r) AS count
+                    CALL {
+                        // Nodes are shaped server-side, ready for the frontend
+                        MATCH (s:Strategy)
+                        WITH s,
+                             toInteger(coalesce(s.wins,   0)) AS w,
+                             toInteger(coalesce(s.losses, 0)) AS l
+                        RETURN collect({
+                            id:            s.name,
+                            name:          s.name,
+                            val:           CASE WHEN w > 1 THEN w ELSE 1 END * 3,  // kept for API compat (frontend ignores)
+                            type:          'Strategy',
+                            wins:          w,
+                            losses:        l,
+                            win_rate:      CASE WHEN w + l > 0
+                                                THEN toFloat(w) / (w + l)
+                                                ELSE 0.5 END,
+                            total_matches: w + l
+                        }) AS nodes
+                    }
+                    CALL {
+                        // BEATS edges aggregated by (winner, loser) pair
+                        MATCH (w:Strategy)-[b:BEATS]->(l:Strategy)
+                        WITH w.name AS source, l.name AS target, count(b) AS wins
+                        RETURN collect({source: source, target: target, type: 'BEATS', wins: wins}) AS beats_links
+                    }
+                    RETURN nodes, beats_links
                     """
                 )
-                loses_records = await loses_result.data()
-
-            nodes = []
-            for r in node_records:
-                wins   = int(r["wins"])
-                losses = int(r["losses"])
-                nodes.append({
-                    "id":            r["id"],
-                    "name":          r["name"],
-                    "val":           max(wins, 1) * 3,   # kept for API compat (frontend ignores)
-                    "type":          "Strategy",
-                    "wins":          wins,
-                    "losses":        losses,
-                    "win_rate":      float(r["win_rate"]),
-                    "total_matches": int(r["total_matches"]),
-                })
-
-            links = []
-            for r in beats_records:
-                links.append({
-                    "source": r["source"],
-                    "target": r["target"],
-                    "type":   "BEATS",
-                    "wins":   int(r["wins"]),
-                })
-            for r in loses_records:
-                links.append({
-                    "source": r["source"],
-                    "target": r["target"],
-                    "type":   "LOSES_TO",
-                    "wins":   int(r["count"]),
-                })
+                record = await result.single()
+
+            if record is None:
+                return {"nodes": [], "links": []}
+            nodes = record["nodes"]
+            beats_links = record["beats_links"]
+            # LOSES_TO edges are always written alongside their BEATS edge, so the
+            # aggregated LOSES_TO links are exactly the BEATS links reversed.
+            loses_links = [
+                {"source": link["target"], "target": link["source"], "type": "LOSES_TO", "wins": link["wins"]}
+                for link in beats_links
+            ]
+            links = beats_links + loses_links
 
             return {"nodes": nodes, "links": links}
         except Exception as e:
@@ -414,61 +493,28 @@ class Neo4jClient:
     async def store_negotiation_round(self, match_id: str, round_data: dict) -> None:
         """Store a negotiation round with offers and outcomes."""
         try:
-            async with self._driver.session() as session:
-                await session.run(
-                    """
-                    MERGE (m:Match {id: $match_id})
-                    SET m.game_type = 'negotiation'
-                    MERGE (r:Round {id: $round_id})
-                    SET r.number = $round, r.game_state_hash = $state_hash
-                    MERGE (m)-[:HAS_ROUND]->(r)
-
-                    MERGE (redMove:Move {id: $red_move_id})
-                    SET redMove.type = $red_type,
-                        redMove.price = $red_price,
-                        redMove.terms = $red_terms
-                    MERGE (r)-[:RED_MOVED]->(redMove)
-
-                    MERGE (blueMove:Move {id: $blue_move_id})
-                    SET blueMove.type = $blue_type,
-                        blueMove.price = $blue_price,
-                        blueMove.terms = $blue_terms
-                    MERGE (r)-[:BLUE_MOVED]->(blueMove)
-
-                    WITH r
-                    UNWIND $predictions AS pred
-                    MERGE (p:Prediction {id: pred.id})
-                    SET p.opponent_move = pred.opponentMove,
-                        p.confidence = pred.confidence,
-                        p.was_correct = pred.wasCorrect,
-                        p.agent = pred.agent
-                    MERGE (p)-[:FOR_ROUND]->(r)
-                    """,
-                    match_id=match_id,
-                    round=round_data["round"],
-                    round_id=f"{match_id}_round_{round_data['round']}",
-                    red_move_id=f"{match_id}_round_{round_data['round']}_red",
-                    blue_move_id=f"{match_id}_round_{round_data['round']}_blue",
-                    state_hash=round_data.get("state_hash", ""),
-                    red_type=round_data["red_move"]["type"],
-                    red_price=round_data["red_move"].get("price", 0),
-                    red_terms=round_data["red_move"].get("terms", ""),
-                    blue_type=round_data["blue_move"]["type"],
-                    blue_price=round_data["blue_move"].get("price", 0),
-                    blue_terms=round_data["blue_move"].get("terms", ""),
-                    predictions=[
-                        {**p, "agent": "red", "id": f"{match_id}_round_{round_data['round']}_red_pred_{i}"}
-                        for i, p in enumerate(round_data.get("red_predictions", []))
-                    ] + [
-                        {**p, "agent": "blue", "id": f"{match_id}_round_{round_data['round']}_blue_pred_{i}"}
-                        for i, p in enumerate(round_data.get("blue_predictions", []))
-                    ],
-                )
+            await self._store_round_graph(
+                match_id,
+                round_data,
+                match_props={"game_type": "negotiation"},
+                round_props={},
+                move_props=lambda move: {
+                    "type": move["type"],
+                    "price": move.get("price", 0),
+                    "terms": move.get("terms", ""),
+                },
+            )
         except Exception as e:
             logger.warning("Failed to store negotiation round in Neo4j: %s", e)
 
-    async def get_negotiation_patterns(self, agent_id: str) -> list[dict]:
-        """Analyze negotiation offer patterns — how an agent's offers evolve."""
+    async def get_negotiation_patterns(
+        self, agent_id: str, limit: Optional[int] = None, offset: int = 0
+    ) -> list[dict]:
+        """Analyze negotiation offer patterns — how an agent's offers evolve.
+
+        Returns every row unless ``limit`` is given; pages follow
+        (match id, round number) order, which is stable but not chronological.
+        """
         try:
             async with self._driver.session() as session:
                 result = await session.run(
@@ -482,8 +528,10 @@ class Neo4jClient:
                            mv.type AS move_type,
                            mv.price AS price
                     ORDER BY m.id, r.number
-                    """,
+                    """ + _page_clause(limit),
                     agent_id=agent_id,
+                    offset=offset,
+                    limit=limit,
                 )
                 records = await result.data()
                 return records
@@ -498,59 +546,27 @@ class Neo4jClient:
     async def store_auction_round(self, match_id: str, round_data: dict) -> None:
         """Store an auction round with bids and item outcomes."""
         try:
-            async with self._driver.session() as session:
-                await session.run(
-                    """
-                    MERGE (m:Match {id: $match_id})
-                    SET m.game_type = 'auction'
-                    MERGE (r:Round {id: $round_id})
-                    SET r.number = $round, r.item_name = $item_name,
-                        r.game_state_hash = $state_hash
-                    MERGE (m)-[:HAS_ROUND]->(r)
-
-                    MERGE (redBid:Move {id: $red_move_id})
-                    SET redBid.type = $red_type,
-                        redBid.amount = $red_amount
-                    MERGE (r)-[:RED_MOVED]->(redBid)
-
-                    MERGE (blueBid:Move {id: $blue_move_id})
-                    SET blueBid.type = $blue_type,
-                        blueBid.amount = $blue_amount
-                    MERGE (r)-[:BLUE_MOVED]->(blueBid)
-
-                    WITH r
-                    UNWIND $predictions AS pred
-                    MERGE (p:Prediction {id: pred.id})
-                    SET p.opponent_move = pred.opponentMove,
-                        p.confidence = pred.confidence,
-                        p.was_correct = pred.wasCorrect,
-                        p.agent = pred.agent
-                    MERGE (p)-[:FOR_ROUND]->(r)
-                    """,
-                    match_id=match_id,
-                    round=round_data["round"],
-                    round_id=f"{match_id}_round_{round_data['round']}",
-                    red_move_id=f"{match_id}_round_{round_data['round']}_red",
-                    blue_move_id=f"{match_id}_round_{round_data['round']}_blue",
-                    state_hash=round_data.get("state_hash", ""),
-                    item_name=round_data.get("item_name", ""),
-                    red_type=round_data["red_move"]["type"],
-                    red_amount=round_data["red_move"].get("amount", 0),
-                    blue_type=round_data["blue_move"]["type"],
-                    blue_amount=round_data["blue_move"].get("amount", 0),
-                    predictions=[
-                        {**p, "agent": "red", "id": f"{match_id}_round_{round_data['round']}_red_pred_{i}"}
-                        for i, p in enumerate(round_data.get("red_predictions", []))
-                    ] + [
-                        {**p, "agent": "blue", "id": f"{match_id}_round_{round_data['round']}_blue_pred_{i}"}
-                        for i, p in enumerate(round_data.get("blue_predictions", []))
-                    ],
-                )
+            await self._store_round_graph(
+                match_id,
+                round_data,
+                match_props={"game_type": "auction"},
+                round_props={"item_name": round_data.get("item_name", "")},
+                move_props=lambda move: {
+                    "type": move["type"],
+                    "amount": move.get("amount", 0),
+                },
+            )
         except Exception as e:
             logger.warning("Failed to store auction round in Neo4j: %s", e)
 
-    async def get_auction_bid_history(self, agent_id: str) -> list[dict]:
-        """Get bidding history for an agent across auction matches."""
+    async def get_auction_bid_history(
+        self, agent_id: str, limit: Optional[int] = None, offset: int = 0
+    ) -> list[dict]:
+        """Get bidding history for an agent across auction matches.
+
+        Returns every row unless ``limit`` is given; pages follow
+        (match id, round number) order, which is stable but not chronological.
+        """
         try:
             async with self._driver.session() as session:
                 result = await session.run(
@@ -565,8 +581,10 @@ class Neo4jClient:
                            mv.type AS move_type,
                            mv.amount AS bid_amount
                     ORDER BY m.id, r.number
-                    """,
+                    """ + _page_clause(limit),
                     agent_id=agent_id,
+                    offset=offset,
+                    limit=limit,
                 )
                 records = await result.data()
                 return records
@@ -579,7 +597,12 @@ class Neo4jClient:
     # ------------------------------------------------------------------
 
     async def init_schema(self) -> None:
-        """Create constraints, indexes, and optional vector index for the strategy graph."""
+        """Create constraints, indexes, and optional vector index for the strategy graph.
+
+        Runs once per process; later calls return without touching the database.
+        """
+        if self._schema_ready:
+            return
         try:
             async with self._driver.session() as session:
                 # Uniqueness constraint on Match.id
@@ -651,6 +674,7 @@ class Neo4jClient:
                 except Exception as e:
                     logger.warning("Failed to create vector index: %s", e)
 
+            self._schema_ready = True
             logger.info("Neo4j schema initialized")
         except Exception as e:
             logger.warning("Failed to initialize Neo4j schema: %s", e)
@@ -683,12 +707,17 @@ class NoOpNeo4jClient:
     async def get_prediction_accuracy(self, agent_id: str) -> list[dict]:
         return []
 
+    async def get_agent_patterns(self, agent_id: str) -> dict:
+        return {"prediction_accuracy": [], "bluff_patterns": []}
+
     async def store_strategy_relationship(
         self, winner_strategy: str, loser_strategy: str, match_id: str = ""
     ) -> None:
         pass
 
-    async def get_strategy_evolution(self, agent_id: str) -> list[dict]:
+    async def get_strategy_evolution(
+        self, agent_id: str, limit: Optional[int] = None, offset: int = 0
+    ) -> list[dict]:
         return []
 
     async def get_win_matrix(self) -> list[dict]:
@@ -703,13 +732,17 @@ class NoOpNeo4jClient:
     async def store_negotiation_round(self, match_id: str, round_data: dict) -> None:
         pass
 
-    async def get_negotiation_patterns(self, agent_id: str) -> list[dict]:
+    async def get_negotiation_patterns(
+        self, agent_id: str, limit: Optional[int] = None, offset: int = 0
+    ) -> list[dict]:
         return []
 
     async def store_auction_round(self, match_id: str, round_data: dict) -> None:
         pass
 
-    async def get_auction_bid_history(self, agent_id: str) -> list[dict]:
+    async def get_auction_bid_history(
+        self, agent_id: str, limit: Optional[int] = None, offset: int = 0
+    ) -> list[dict]:
         return []
 
 
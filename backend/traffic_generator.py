@@ -9,28 +9,60 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import atexit
 import logging
 import os
+import queue
 import random
 import sys
 import time
-from datetime import datetime, timezone
+from collections import Counter
+from logging.handlers import QueueHandler, QueueListener
 
 # Ensure mock mode for traffic generation
 os.environ.setdefault("MOCK_MODE", "true")
 
+from backend.agent import AgentPredictor
+from backend.datadog_metrics import arena_metrics, dd
 from backend.match import Match, MatchConfig
 from backend.mongodb_client import get_mongodb_client
 from backend.neo4j_client import get_neo4j_client
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s %(name)s %(levelname)s %(message)s",
-)
+# Hand log records to a background thread so concurrent matches never block
+# on stdout writes from the event loop.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(levelname)s %(message)s"))
+_log_listener = QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+# Added directly rather than via basicConfig, which would give the QueueHandler a
+# formatter of its own and format every record twice.
+_root_logger = logging.getLogger()
+_root_logger.setLevel(logging.INFO)
+_root_logger.addHandler(QueueHandler(_log_queue))
 logger = logging.getLogger(__name__)
 
-PERSONALITIES = ["aggressive", "defensive", "adaptive", "chaotic"]
-GAME_TYPES = ["resource_wars", "negotiation", "auction"]
+PERSONALITIES = ("aggressive", "defensive", "adaptive", "chaotic")
+GAME_TYPES = ("resource_wars", "negotiation", "auction")
+
+_SUMMARY_RULE = "=" * 60
+
+# AgentPredictor holds no per-match state, so one instance per
+# (side, personality, game type) is shared by every generated match and
+# its Neo4j pattern cache stays warm across matches.
+_AGENT_CACHE: dict[tuple[str, str, str], AgentPredictor] = {}
+
+
+def _get_agent(side: str, personality: str, game_type: str) -> AgentPredictor:
+    key = (side, personality, game_type)
+    agent = _AGENT_CACHE.get(key)
+    if agent is None:
+        agent = _AGENT_CACHE[key] = AgentPredictor(
+            side, personality, game_type=game_type,
+            neo4j_client=get_neo4j_client(), metrics=arena_metrics,
+        )
+    return agent
 
 
 async def run_single_match(
@@ -40,10 +72,7 @@ async def run_single_match(
     blue_personality: str,
     total_rounds: int = 10,
 ) -> dict:
-    """Run a single match and store results."""
-    mongo = get_mongodb_client()
-    neo4j = get_neo4j_client()
-
+    """Run a single match. Match itself persists rounds and results to MongoDB/Neo4j."""
     config = MatchConfig(
         game_type=game_type,
         red_personality=red_personality,
@@ -59,71 +88,20 @@ async def run_single_match(
         game_type, total_rounds,
     )
 
-    # Initialize match document in MongoDB
-    match_doc = {
-        "match_id": match_id,
-        "game_type": game_type,
-        "agents": {
-            "red": {"personality": red_personality, "model": "mock"},
-            "blue": {"personality": blue_personality, "model": "mock"},
-        },
-        "total_rounds": total_rounds,
-        "started_at": datetime.now(timezone.utc).isoformat(),
-        "state": "running",
-        "rounds": [],
-    }
-    mongo.store_match(match_doc)
-
-    match = Match(config=config)
-    events = []
-    round_num = 0
+    match = Match(
+        config=config,
+        red_agent=_get_agent("red", red_personality, game_type),
+        blue_agent=_get_agent("blue", blue_personality, game_type),
+    )
+    match_end: dict = {}
     start_time = time.time()
 
     async for event in match.run_match():
-        events.append(event)
-        etype = event.get("type")
-
-        if etype == "round_end":
-            round_num = event.get("round", round_num)
-
-        if etype == "collapse":
-            # Build round data for MongoDB storage
-            resolution = event.get("resolution", {})
-            red_preds = event.get("redPredictions", [])
-            blue_preds = event.get("bluePredictions", [])
-
-            # Find the most recent thinking_end events for moves
-            red_move = None
-            blue_move = None
-            for e in reversed(events):
-                if e.get("type") == "thinking_end" and e.get("agent") == "red" and red_move is None:
-                    red_move = e.get("chosenMove")
-                if e.get("type") == "thinking_end" and e.get("agent") == "blue" and blue_move is None:
-                    blue_move = e.get("chosenMove")
-                if red_move and blue_move:
-                    break
-
-            round_data = {
-                "round": round_num + 1,
-                "red": {
-                    "predictions": red_preds,
-                    "chosen_move": red_move,
-                },
-                "blue": {
-                    "predictions": blue_preds,
-                    "chosen_move": blue_move,
-                },
-                "resolution": resolution,
-            }
-            mongo.store_round(match_id, round_data)
-
-        if etype == "match_end":
-            mongo.finalize_match(match_id, event)
+        if event.get("type") == "match_end":
+            match_end = event
 
     elapsed = time.time() - start_time
 
-    # Extract final results
-    match_end = next((e for e in reversed(events) if e.get("type") == "match_end"), {})
     winner = match_end.get("winner", "draw")
     final_scores = match_end.get("finalScores", {})
 
@@ -145,7 +123,7 @@ async def run_single_match(
 
 async def generate_traffic(
     num_matches: int,
-    game_types: list[str],
+    game_types: tuple[str, ...],
     concurrency: int = 1,
 ) -> list[dict]:
     """Run N matches with random personality pairings."""
@@ -170,16 +148,27 @@ async def generate_traffic(
     results = []
     semaphore = asyncio.Semaphore(concurrency)
 
-    async def _run_with_semaphore(index: int) -> dict:
+    async def _run_with_semaphore(
+        index: int, game_type: str, red: str, blue: str, rounds: int,
+    ) -> dict:
         async with semaphore:
-            game_type = random.choice(game_types)
-            red = random.choice(PERSONALITIES)
-            blue = random.choice(PERSONALITIES)
-            rounds = random.choice([8, 10, 12])
             return await run_single_match(index, game_type, red, blue, rounds)
 
-    tasks = [_run_with_semaphore(i) for i in range(num_matches)]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    # Draw every match's parameters up front, one C-level call per column
+    pairings = zip(
+        random.choices(game_types, k=num_matches),
+        random.choices(PERSONALITIES, k=num_matches),
+        random.choices(PERSONALITIES, k=num_matches),
+        random.choices((8, 10, 12), k=num_matches),
+    )
+    tasks = [_run_with_semaphore(i, *params) for i, params in enumerate(pairings)]
+    try:
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        # Send buffered metrics and close pooled connections while the loop is alive
+        dd.flush()
+        await neo4j.close()
+        mongo.close()
 
     # Filter out exceptions
     completed = []
@@ -198,39 +187,37 @@ def print_summary(results: list[dict]) -> None:
         print("\nNo matches completed.")
         return
 
-    print(f"\n{'=' * 60}")
-    print(f"  Traffic Generation Summary")
-    print(f"{'=' * 60}")
-    print(f"  Total matches: {len(results)}")
-
     # Win counts by personality
-    wins: dict[str, int] = {}
-    appearances: dict[str, int] = {}
-    for r in results:
-        for side in ["red_personality", "blue_personality"]:
-            p = r[side]
-            appearances[p] = appearances.get(p, 0) + 1
-        winner_side = r.get("winner", "draw")
-        if winner_side == "red":
-            p = r["red_personality"]
-            wins[p] = wins.get(p, 0) + 1
-        elif winner_side == "blue":
-            p = r["blue_personality"]
-            wins[p] = wins.get(p, 0) + 1
-
-    print(f"\n  {'Personality':<15} {'Matches':<10} {'Wins':<8} {'Win Rate':<10}")
-    print(f"  {'-' * 43}")
+    appearances = Counter(r["red_personality"] for r in results)
+    appearances.update(r["blue_personality"] for r in results)
+    wins = Counter(
+        r[f"{r['winner']}_personality"]
+        for r in results
+        if r.get("winner") in ("red", "blue")
+    )
+
+    # Assemble the whole table and write it in one call
+    lines = [
+        f"\n{_SUMMARY_RULE}",
+        "  Traffic Generation Summary",
+        _SUMMARY_RULE,
+        f"  Total matches: {len(results)}",
+        f"\n  {'Personality':<15} {'Matches':<10} {'Wins':<8} {'Win Rate':<10}",
+        f"  {'-' * 43}",
+    ]
     for p in sorted(appearances.keys()):
         total = appearances[p]
-        w = wins.get(p, 0)
+        w = wins[p]
         rate = w / total if total > 0 else 0
-        print(f"  {p:<15} {total:<10} {w:<8} {rate:.1%}")
+        lines.append(f"  {p:<15} {total:<10} {w:<8} {rate:.1%}")
 
     total_time = sum(r.get("elapsed", 0) for r in results)
     avg_time = total_time / len(results) if results else 0
-    print(f"\n  Total time: {total_time:.1f}s")
-    print(f"  Avg match time: {avg_time:.1f}s")
-    print(f"{'=' * 60}\n")
+    lines.append(f"\n  Total time: {total_time:.1f}s")
+    lines.append(f"  Avg match time: {avg_time:.1f}s")
+    lines.append(f"{_SUMMARY_RULE}\n")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def main():
@@ -248,12 +235,21 @@ def main():
     if args.game_types == "all":
         game_types = GAME_TYPES
     else:
-        game_types = [g.strip() for g in args.game_types.split(",")]
+        game_types = tuple(g.strip() for g in args.game_types.split(","))
 
     logger.info("Starting traffic generation: %d matches, types=%s, concurrency=%d",
                 args.matches, game_types, args.concurrency)
 
-    results = asyncio.run(generate_traffic(args.matches, game_types, args.concurrency))
+    # uvloop ships with uvicorn[standard]; fall back to the stock loop without it
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+    if uvloop is not None and not hasattr(uvloop, "run"):
+        # uvloop < 0.18 has no run(); install its loop policy for asyncio.run
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    run = getattr(uvloop, "run", asyncio.run)
+    results = run(generate_traffic(args.matches, game_types, args.concurrency))
     print_summary(results)
 
 